@@ -1,6 +1,8 @@
 from ._factory import create_app as create_app, create_router as create_router
 from .dependencies import Dependencies as Dependencies
 from ._config import logger as logger
+from ._defaults import new_workspace_client as new_workspace_client
+from ._static import cached_json_response as cached_json_response
 
 # NOTE: The apx `lakebase` addon ships `core/lakebase.py`, a startup-bound
 # LifespanDependency for a single *Provisioned* instance (ws.database + SQLModel).
@@ -3,6 +3,7 @@ from typing import Annotated, AsyncGenerator, TypeAlias
 from contextlib import asynccontextmanager
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.config import Config
 from fastapi import Depends, FastAPI, Request
 
 from ._base import LifespanDependency
@@ -10,6 +11,24 @@ from ._config import AppConfig, logger
 from ._headers import HeadersDependency
 
 
+# Sync endpoints run on anyio's 40-thread pool and all share the SP client (OBO clients
+# are shared per token), so the SDK's HTTP connection pool — 20 by default, and blocking
+# once exhausted — is sized to that concurrency instead of queueing calls behind it.
+SDK_HTTP_POOL_SIZE = 40
+
+
+def new_workspace_client(**kwargs) -> WorkspaceClient:
+    """A WorkspaceClient (``kwargs`` are SDK ``Config`` fields) with its HTTP
+    connection pool sized for the app's request concurrency."""
+    return WorkspaceClient(
+        config=Config(
+            max_connection_pools=SDK_HTTP_POOL_SIZE,
+            max_connections_per_pool=SDK_HTTP_POOL_SIZE,
+            **kwargs,
+        )
+    )
+
+
 class _ConfigDependency(LifespanDependency):
     @asynccontextmanager
     async def lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:
@@ -25,7 +44,7 @@ class _ConfigDependency(LifespanDependency):
 class _WorkspaceClientDependency(LifespanDependency):
     @asynccontextmanager
     async def lifespan(self, app: FastAPI) -> AsyncGenerator[None, None]:
-        app.state.workspace_client = WorkspaceClient()
+        app.state.workspace_client = new_workspace_client()
         yield
 
     @staticmethod
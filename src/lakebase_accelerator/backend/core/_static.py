@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import os
 
 from fastapi import FastAPI, Request
@@ -43,6 +44,27 @@ class CachedStaticFiles(StaticFiles):
         return response
 
 
+def cached_json_response(request: Request, body: bytes, *, max_age: int = 0) -> Response:
+    """Serve a pre-encoded JSON body with an ETag, answering 304 on a matching
+    ``If-None-Match``.
+
+    For API responses that are constant for the life of the process: the client may
+    reuse its copy for ``max_age`` seconds (0 = always revalidate), and revalidation
+    costs no body transfer.
+    """
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    headers = {
+        "etag": etag,
+        "cache-control": f"private, max-age={max_age}" if max_age > 0 else "no-cache",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def add_not_found_handler(app: FastAPI) -> None:
     """Register a handler that serves the SPA index.html for non-API 404s."""
 
@@ -58,7 +80,7 @@ def add_not_found_handler(app: FastAPI) -> None:
             is_get_page_nav = request.method == "GET" and "text/html" in accept
 
             # Heuristic: if the last path segment looks like a file (has a dot), don't SPA-fallback
-            looks_like_asset = "." in path.split("/")[-1]
+            looks_like_asset = "." in path.rpartition("/")[2]
 
             if (not is_api) and is_get_page_nav and (not looks_like_asset):
                 # Let the SPA router handle it
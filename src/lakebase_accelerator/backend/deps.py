@@ -11,19 +11,35 @@ Deploy-primary + dev-fallback auth model:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Annotated, TypeAlias
 
 from databricks.sdk import WorkspaceClient
 from fastapi import Depends, Request
 
+from .core import new_workspace_client
+
+
+@lru_cache(maxsize=64)
+def _obo_client(token: str) -> WorkspaceClient:
+    """One OBO client per forwarded token.
+
+    Building a WorkspaceClient resolves config and opens a fresh HTTP session, so a
+    client per request paid that (plus new TCP/TLS connections) on every call. The
+    forwarded token is stable for a user's session, so its client — and that
+    client's keep-alive connections — are reused until the token rotates and the
+    old entry ages out of the LRU.
+    """
+    # auth_type=pat to avoid the SDK trying SP/CLI auth alongside the token
+    return new_workspace_client(token=token, auth_type="pat")
+
 
 def get_effective_ws(request: Request) -> WorkspaceClient:
     """Return an OBO WorkspaceClient when a forwarded user token is present,
     otherwise the service-principal client created at app startup."""
     token = request.headers.get("X-Forwarded-Access-Token")
     if token:
-        # auth_type=pat to avoid the SDK trying SP/CLI auth alongside the token
-        return WorkspaceClient(token=token, auth_type="pat")
+        return _obo_client(token)
     return request.app.state.workspace_client
 
 
@@ -1,15 +1,20 @@
 from databricks.sdk.service.iam import User as UserOut
+from fastapi import Request
 
-from .core import Dependencies, create_router
+from .core import Dependencies, cached_json_response, create_router
 from .models import VersionOut
 from . import routers as _routers  # noqa: F401 - registers feature routes on the singleton
 
 router = create_router()
 
 
+# The version never changes while the process runs; encoded once, revalidated by ETag.
+_VERSION_BODY = VersionOut.from_metadata().model_dump_json().encode()
+
+
 @router.get("/version", response_model=VersionOut, operation_id="version")
-async def version():
-    return VersionOut.from_metadata()
+async def version(request: Request):
+    return cached_json_response(request, _VERSION_BODY)
 
 
 @router.get("/current-user", response_model=UserOut, operation_id="currentUser")
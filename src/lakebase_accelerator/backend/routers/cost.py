@@ -103,7 +103,7 @@ def get_run_cost(req: RunCostIn, ws: EffectiveClient) -> RunCostOut:
             total_queries=req.total_queries,
             discount=req.discount,
         )
-        out = RunCostOut(estimate=RunCostEstimateOut(**est.__dict__))
+        out = RunCostOut(estimate=RunCostEstimateOut.model_validate(est, from_attributes=True))
         if req.start and req.end:
             rec = cost.reconcile_run_cost(
                 ws,
@@ -116,10 +116,10 @@ def get_run_cost(req: RunCostIn, ws: EffectiveClient) -> RunCostOut:
                 duration_seconds=req.duration_seconds,
                 discount=req.discount,
             )
-            out.reconcile = RunCostReconcileOut(**rec.__dict__)
+            out.reconcile = RunCostReconcileOut.model_validate(rec, from_attributes=True)
         return out
     except Exception as e:  # noqa: BLE001
-        logger.info(f"get_run_cost failed for {req.project}: {e}")
+        logger.info("get_run_cost failed for %s: %s", req.project, e)
         return RunCostOut(error=str(e))
 
 
@@ -133,27 +133,9 @@ def get_lakebase_cost(req: CostUsageIn, ws: EffectiveClient) -> CostUsageOut:
     try:
         uid = lakebase_service.resolve_project_uid(ws, req.project)
         report = cost.get_lakebase_cost(ws, uid, req.warehouse_id, req.days)
-        return CostUsageOut(
-            project_uid=report.project_uid,
-            days=report.days,
-            rows=[
-                CostDayOut(
-                    usage_date=d.usage_date,
-                    compute_dbus=d.compute_dbus,
-                    compute_cost=d.compute_cost,
-                    branch_storage_dsu=d.branch_storage_dsu,
-                    pitr_storage_dsu=d.pitr_storage_dsu,
-                    expiring_storage_dsu=d.expiring_storage_dsu,
-                    storage_dsu=d.storage_dsu,
-                    storage_cost=d.storage_cost,
-                    total_cost=d.total_cost,
-                )
-                for d in report.rows
-            ],
-            compute_cost=report.compute_cost,
-            storage_cost=report.storage_cost,
-            total_cost=report.total_cost,
-        )
+        # CostReport / CostDay mirror the response models field for field, so validate
+        # the report as-is (rows included) instead of rebuilding each day by hand.
+        return CostUsageOut.model_validate(report, from_attributes=True)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"get_lakebase_cost failed for {req.project}: {e}")
+        logger.info("get_lakebase_cost failed for %s: %s", req.project, e)
         return CostUsageOut(days=req.days, error=str(e))
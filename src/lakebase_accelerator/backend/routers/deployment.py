@@ -96,7 +96,7 @@ def create_project(req: CreateProjectIn, ws: EffectiveClient) -> CreateProjectOu
         )
         return CreateProjectOut(ok=True, name=name, detail=f"Created project {name} ({req.min_cu}–{req.max_cu} CU)")
     except Exception as e:  # noqa: BLE001
-        logger.info(f"create_project failed: {e}")
+        logger.info("create_project failed: %s", e)
         return CreateProjectOut(ok=False, detail=str(e))
 
 
@@ -129,7 +129,7 @@ def list_warehouses(ws: EffectiveClient) -> WarehouseListOut:
             ]
         )
     except Exception as e:  # noqa: BLE001
-        logger.info(f"Could not list warehouses: {e}")
+        logger.info("Could not list warehouses: %s", e)
         return WarehouseListOut(warehouses=[], error=str(e))
 
 
@@ -189,7 +189,7 @@ def get_table_size(req: TableSizeIn, ws: EffectiveClient) -> TableSizeOut:
             ok=r.ok, uncompressed_bytes=r.uncompressed_bytes, size_mb=r.size_mb, message=r.message,
         )
     except Exception as e:  # noqa: BLE001
-        logger.info(f"get_table_size failed for {req.table_full_name}: {e}")
+        logger.info("get_table_size failed for %s: %s", req.table_full_name, e)
         return TableSizeOut(ok=False, uncompressed_bytes=0, size_mb=0.0, message=str(e))
 
 
@@ -235,7 +235,7 @@ def get_project_info(ws: EffectiveClient, project: str) -> ProjectInfoOut:
             ],
         )
     except Exception as e:  # noqa: BLE001
-        logger.info(f"get_project_info failed for {project}: {e}")
+        logger.info("get_project_info failed for %s: %s", project, e)
         return ProjectInfoOut(name=project, error=str(e))
 
 
@@ -257,7 +257,7 @@ def set_endpoint_cu(req: SetCuIn, ws: EffectiveClient) -> OpResultOut:
         deployment.set_endpoint_cu(ws, req.endpoint_name, req.min_cu, req.max_cu)
         return OpResultOut(ok=True, detail=f"Updated {req.endpoint_name} to {req.min_cu}-{req.max_cu} CU")
     except Exception as e:  # noqa: BLE001
-        logger.info(f"set_endpoint_cu failed: {e}")
+        logger.info("set_endpoint_cu failed: %s", e)
         return OpResultOut(ok=False, detail=str(e))
 
 
@@ -290,9 +290,9 @@ def create_synced_table(req: SyncTableIn, ws: EffectiveClient) -> OpResultOut:
             branch=req.branch,
             database=req.database,
         )
-        return OpResultOut(ok=True, detail=f"Synced table created: {name}")
+        return OpResultOut(ok=True, detail=f"Synced table creation started: {name}")
     except Exception as e:  # noqa: BLE001
-        logger.info(f"create_synced_table failed: {e}")
+        logger.info("create_synced_table failed: %s", e)
         return OpResultOut(ok=False, detail=str(e))
 
 
@@ -13,11 +13,11 @@ from __future__ import annotations
 
 import psycopg
 from fastapi import Request
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ..core import create_router, logger
 from ..deps import EffectiveClient
-from ..services import auth, history
+from ..services import auth, history, lakebase_service
 from .testing import QueryIn
 
 router = create_router()
@@ -94,6 +94,11 @@ class HistoryListOut(BaseModel):
     error: str | None = None
 
 
+# Built once at import: validating the whole row list in one call runs a single
+# pydantic-core pass instead of constructing (and validating) each model in Python.
+_HISTORY_RUNS = TypeAdapter(list[HistoryRunOut])
+
+
 def _sp_creds(req: HistoryConnIn, request: Request):
     """Resolve Lakebase credentials under the app service principal (not the OBO user).
 
@@ -114,20 +119,20 @@ def _sp_creds(req: HistoryConnIn, request: Request):
 
 def _current_user(ws: EffectiveClient) -> str | None:
     try:
-        me = ws.current_user.me()
+        me = lakebase_service.get_current_user(ws)
         return me.user_name or getattr(me, "application_id", None) or me.id
     except Exception as e:  # noqa: BLE001
-        logger.info(f"history: could not resolve OBO identity: {e}")
+        logger.info("history: could not resolve OBO identity: %s", e)
         return None
 
 
 def _sp_identity(request: Request) -> str:
     """The app service principal's identity (used as its Postgres role name)."""
     try:
-        me = request.app.state.workspace_client.current_user.me()
+        me = lakebase_service.get_current_user(request.app.state.workspace_client)
         return getattr(me, "application_id", None) or me.user_name or me.id or "<app-service-principal>"
     except Exception as e:  # noqa: BLE001
-        logger.info(f"history: could not resolve SP identity: {e}")
+        logger.info("history: could not resolve SP identity: %s", e)
         return "<app-service-principal>"
 
 
@@ -162,7 +167,7 @@ def enable_lakebase_history(req: HistoryConnIn, request: Request) -> HistoryEnab
     except psycopg.OperationalError as e:
         # Layer 1: the SP has no role in this project (or can't connect) — emit the
         # role-creation + owned-schema setup so a project owner can provision it.
-        logger.info(f"history enable: SP cannot connect to project: {e}")
+        logger.info("history enable: SP cannot connect to project: %s", e)
         sp = _sp_identity(request)
         return HistoryEnableOut(
             ok=False,
@@ -176,7 +181,7 @@ def enable_lakebase_history(req: HistoryConnIn, request: Request) -> HistoryEnab
             error=str(e),
         )
     except Exception as e:  # noqa: BLE001
-        logger.info(f"history enable failed: {e}")
+        logger.info("history enable failed: %s", e)
         return HistoryEnableOut(ok=False, message="Could not enable Lakebase history", error=str(e), ddl=_safe_ddl(req.schema_name, req.table_name))
 
 
@@ -187,7 +192,7 @@ def list_lakebase_history_tables(req: HistoryConnIn, request: Request) -> Histor
         creds = _sp_creds(req, request)
         return HistoryTablesOut(tables=history.list_tables(creds, req.schema_name))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"history tables list failed: {e}")
+        logger.info("history tables list failed: %s", e)
         return HistoryTablesOut(error=str(e))
 
 
@@ -207,7 +212,7 @@ def archive_lakebase_history(req: HistoryArchiveIn, request: Request, ws: Effect
         )
         return HistoryArchiveOut(ok=True, inserted=inserted)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"history archive failed: {e}")
+        logger.info("history archive failed: %s", e)
         return HistoryArchiveOut(ok=False, error=str(e))
 
 
@@ -217,9 +222,9 @@ def list_lakebase_history(req: HistoryConnIn, request: Request) -> HistoryListOu
     try:
         creds = _sp_creds(req, request)
         runs = history.list_runs(creds, req.schema_name, req.table_name)
-        return HistoryListOut(runs=[HistoryRunOut(**r) for r in runs])
+        return HistoryListOut(runs=_HISTORY_RUNS.validate_python(runs))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"history list failed: {e}")
+        logger.info("history list failed: %s", e)
         return HistoryListOut(error=str(e))
 
 
@@ -274,6 +279,9 @@ class SavedQueryListOut(BaseModel):
     error: str | None = None
 
 
+_SAVED_QUERY_SETS = TypeAdapter(list[SavedQuerySetOut])
+
+
 class SavedQueryDeleteOut(BaseModel):
     ok: bool
     deleted: int = 0
@@ -308,7 +316,7 @@ def save_lakebase_query_set(req: SavedQuerySaveIn, request: Request, ws: Effecti
         )
         return SavedQuerySaveOut(ok=True, id=set_id)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"save query set failed: {e}")
+        logger.info("save query set failed: %s", e)
         return SavedQuerySaveOut(ok=False, error=str(e))
 
 
@@ -323,9 +331,9 @@ def list_lakebase_query_sets(req: SavedQueryListIn, request: Request, ws: Effect
             current_user=_current_user(ws),
             include_shared=req.include_shared,
         )
-        return SavedQueryListOut(sets=[SavedQuerySetOut(**s) for s in sets])
+        return SavedQueryListOut(sets=_SAVED_QUERY_SETS.validate_python(sets))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"list query sets failed: {e}")
+        logger.info("list query sets failed: %s", e)
         return SavedQueryListOut(error=str(e))
 
 
@@ -339,5 +347,5 @@ def delete_lakebase_query_set(req: SavedQueryDeleteIn, request: Request, ws: Eff
         )
         return SavedQueryDeleteOut(ok=True, deleted=deleted)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"delete query set failed: {e}")
+        logger.info("delete query set failed: %s", e)
         return SavedQueryDeleteOut(ok=False, error=str(e))
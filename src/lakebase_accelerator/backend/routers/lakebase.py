@@ -34,7 +34,7 @@ class WorkspaceInfoOut(BaseModel):
 def get_workspace_info(ws: EffectiveClient) -> WorkspaceInfoOut:
     """Return the workspace URL, used to deep-link into Catalog Explorer / native dialogs."""
     host = getattr(ws.config, "host", None)
-    return WorkspaceInfoOut(host=host.rstrip("/") if host else None)
+    return WorkspaceInfoOut(host=lakebase_service.normalize_workspace_url(host) if host else None)
 
 
 class ProjectOut(BaseModel):
@@ -117,7 +117,7 @@ def list_lakebase_projects(ws: EffectiveClient) -> ProjectListOut:
         ]
         return ProjectListOut(projects=projects)
     except Exception as e:  # noqa: BLE001 - surface as soft error for the dropdown
-        logger.info(f"Could not list Lakebase projects: {e}")
+        logger.info("Could not list Lakebase projects: %s", e)
         return ProjectListOut(projects=[], error=str(e))
 
 
@@ -133,7 +133,7 @@ def list_lakebase_databases(ws: EffectiveClient, project: str) -> DatabaseListOu
     try:
         return DatabaseListOut(databases=lakebase_service.list_databases(ws, project))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"Could not list databases for {project}: {e}")
+        logger.info("Could not list databases for %s: %s", project, e)
         return DatabaseListOut(databases=[], error=str(e))
 
 
@@ -151,7 +151,7 @@ def list_lakebase_schemas(
     try:
         return SchemaListOut(schemas=lakebase_service.list_schemas(ws, project, database))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"Could not list schemas for {project}/{database}: {e}")
+        logger.info("Could not list schemas for %s/%s: %s", project, database, e)
         return SchemaListOut(schemas=[], error=str(e))
 
 
@@ -167,5 +167,5 @@ def list_lakebase_branches(ws: EffectiveClient, project: str) -> BranchListOut:
     try:
         return BranchListOut(branches=lakebase_service.list_branches(ws, project))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"Could not list branches for {project}: {e}")
+        logger.info("Could not list branches for %s: %s", project, e)
         return BranchListOut(branches=[], error=str(e))
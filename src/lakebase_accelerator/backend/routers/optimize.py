@@ -130,7 +130,7 @@ def explain_queries(req: ExplainIn, ws: EffectiveClient) -> ExplainOut:
             ]
         )
     except Exception as e:  # noqa: BLE001
-        logger.info(f"explain_queries failed: {e}")
+        logger.info("explain_queries failed: %s", e)
         return ExplainOut(error=str(e))
 
 
@@ -153,7 +153,7 @@ def apply_indexes(req: ApplyIndexIn, ws: EffectiveClient) -> ApplyIndexesOut:
         results = optimize.apply_indexes(creds, req.ddls, req.db_schema)
         return ApplyIndexesOut(results=[ApplyResultOut(**r) for r in results])
     except Exception as e:  # noqa: BLE001
-        logger.info(f"apply_indexes failed: {e}")
+        logger.info("apply_indexes failed: %s", e)
         return ApplyIndexesOut(error=str(e))
 
 
@@ -205,7 +205,7 @@ def optimize_analyze(req: OptimizeIn, ws: EffectiveClient) -> OptimizeOut:
                 ))
             live_ran = True
         except Exception as e:  # noqa: BLE001
-            logger.info(f"optimize live introspection failed: {e}")
+            logger.info("optimize live introspection failed: %s", e)
             error = f"Live introspection skipped: {e}"
 
     suggestions = [
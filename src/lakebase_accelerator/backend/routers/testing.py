@@ -9,13 +9,17 @@ identity (primary) or pasted OAuth (dev) — never static username & password.
 
 from __future__ import annotations
 
-from fastapi import HTTPException, Request
-from pydantic import BaseModel, Field
+import asyncio
+from functools import lru_cache
+from typing import Literal
 
-from ..core import create_router, logger
+from databricks.sdk import WorkspaceClient
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..core import cached_json_response, create_router, logger
 from ..deps import EffectiveClient
-from ..services import auth, lakebase_service, pgbench_job, pgbench_local, query_format
-from ..services.connection import ConnectionPool
+from ..services import auth, connection, lakebase_service, pgbench_job, pgbench_local, query_format
 
 router = create_router()
 
@@ -28,12 +32,53 @@ def _app_sp(request: Request):
     return request.app.state.workspace_client
 
 
+def _resolve_creds(
+    ws: WorkspaceClient, req: PsycopgTestIn | PgbenchSubmitIn, label: str
+) -> auth.PgCredentials | str:
+    """Resolve Postgres credentials from a test request's auth fields.
+
+    Shared by the psycopg and pgbench submit endpoints so the failure is logged and
+    worded the same way everywhere; returns the credentials or the error message and
+    leaves shaping the soft-error response to the caller.
+    """
+    try:
+        creds = auth.resolve(
+            ws,
+            auth_method=req.auth_method,
+            project=req.project,
+            database=req.database,
+            endpoint_host=req.endpoint_host,
+            access_token=req.access_token,
+            postgres_user_name=req.postgres_user_name,
+        )
+    except Exception as e:  # noqa: BLE001
+        logger.info("%s auth resolution failed: %s", label, e)
+        return f"Authentication failed: {e}"
+    return creds
+
+
+# Request models are validated once and only read afterwards; freezing them makes
+# that explicit — a request handed to worker threads or background runs can't be
+# mutated underneath them — and makes query items hashable.
+_FROZEN = ConfigDict(frozen=True)
+
+# Request-size bounds for the query mix, enforced at validation before any parsing,
+# credential resolution or script writes happen. Generous for hand-written suites.
+_MAX_QUERIES = 1000
+_MAX_QUERY_CHARS = 1_000_000
+
+
 class QueryIn(BaseModel):
-    identifier: str
-    content: str
+    model_config = _FROZEN
+
+    # Also the local pgbench script file name, hence the short bound.
+    identifier: str = Field(max_length=200)
+    content: str = Field(max_length=_MAX_QUERY_CHARS)
 
 
 class PsycopgTestIn(BaseModel):
+    model_config = _FROZEN
+
     auth_method: auth.AuthMethod = "identity"
     project: str | None = None
     database: str | None = None
@@ -47,7 +92,7 @@ class PsycopgTestIn(BaseModel):
     # workload
     concurrency_level: int = Field(default=10, ge=1, le=1000)
     total_executions: int = Field(default=100, ge=1, le=100000)
-    queries: list[QueryIn]
+    queries: list[QueryIn] = Field(max_length=_MAX_QUERIES)
 
 
 class QueryStat(BaseModel):
@@ -59,6 +104,15 @@ class QueryStat(BaseModel):
     p99_time_ms: float | None = None
 
 
+class PoolMetricsOut(BaseModel):
+    # "active" once the engine exists, "not_initialized" for a run that never connected.
+    status: str
+    pool_size: int | None = None
+    checked_in_connections: int | None = None
+    checked_out_connections: int | None = None
+    overflow: int | None = None
+
+
 class TestReportOut(BaseModel):
     concurrency_level: int
     total_queries_executed: int
@@ -75,7 +129,7 @@ class TestReportOut(BaseModel):
     throughput_queries_per_second: float
     total_duration_seconds: float
     cache_hit_pct: float | None = None
-    connection_pool_metrics: dict
+    connection_pool_metrics: PoolMetricsOut
     per_query: list[QueryStat] = Field(default_factory=list)
     monitoring_url: str | None = None
     error: str | None = None
@@ -91,57 +145,60 @@ async def run_psycopg_test(req: PsycopgTestIn, ws: EffectiveClient) -> TestRepor
     if not req.queries:
         return _empty_report(req.concurrency_level, "No queries provided.")
 
+    # This handler is async (the workload itself is awaited), so every blocking
+    # step around it — query parsing, SDK round-trips for credentials, the pool's
+    # TCP+TLS+auth warm-up — runs on a worker thread to keep the event loop serving
+    # other requests (e.g. status polls) meanwhile. Queries are parsed first: a
+    # malformed query fails fast without paying for credential resolution.
     try:
-        creds = auth.resolve(
-            ws,
-            auth_method=req.auth_method,
-            project=req.project,
-            database=req.database,
-            endpoint_host=req.endpoint_host,
-            access_token=req.access_token,
-            postgres_user_name=req.postgres_user_name,
-        )
-    except Exception as e:  # noqa: BLE001
-        logger.info(f"psycopg auth resolution failed: {e}")
-        return _empty_report(req.concurrency_level, f"Authentication failed: {e}")
-
-    try:
-        parsed = [query_format.parse_query(q.identifier, q.content) for q in req.queries]
-        execution_queries = query_format.to_execution_queries(parsed)
+        execution_queries = await asyncio.to_thread(_execution_queries, req.queries)
     except ValueError as e:
         return _empty_report(req.concurrency_level, str(e))
 
-    pool = ConnectionPool()
+    creds = await asyncio.to_thread(_resolve_creds, ws, req, "psycopg")
+    if isinstance(creds, str):
+        return _empty_report(req.concurrency_level, creds)
+
+    # Lease a warm pool (reused across runs with the same endpoint/identity/shape) so
+    # repeat runs don't pay the TCP+TLS+auth handshake for every connection again.
+    base_pool_size, max_overflow = connection.pool_sizing(req.concurrency_level)
     try:
-        pool.initialize(
-            host=creds.host,
-            port=creds.port,
-            database=creds.database,
-            user=creds.user,
-            password=creds.password,
-            ssl_mode=creds.ssl_mode,
-            # Persistent pool sized to the concurrency level so each worker reuses a
-            # warm connection instead of paying a TCP+TLS+auth handshake per query
-            # (QueuePool closes *overflow* connections on return). A small overflow
-            # absorbs the cache-counter probes that run alongside the workload.
-            base_pool_size=req.concurrency_level,
-            max_overflow=max(2, req.concurrency_level // 4),
+        pool = await asyncio.to_thread(
+            connection.acquire_pool,
+            creds,
+            base_pool_size=base_pool_size,
+            max_overflow=max_overflow,
             schema=req.db_schema,
         )
     except ValueError as e:
         return _empty_report(req.concurrency_level, str(e))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"psycopg pool init failed: {e}")
+        logger.info("psycopg pool init failed: %s", e)
         return _empty_report(req.concurrency_level, f"Connection failed: {e}")
 
+    # The monitoring deep link only needs the credentials (plus a workspace-id round
+    # trip), so build it alongside the workload rather than after it.
+    monitoring = asyncio.create_task(
+        asyncio.to_thread(lakebase_service.build_monitoring_url, ws, creds)
+    )
     try:
         report = await pool.run_concurrent(
             execution_queries, req.concurrency_level, req.total_executions
         )
-        monitoring_url = lakebase_service.build_monitoring_url(ws, creds)
-        return TestReportOut(**report, monitoring_url=monitoring_url)
+        return TestReportOut(**report, monitoring_url=await monitoring)
     finally:
-        pool.close()
+        monitoring.cancel()
+        connection.release_pool(pool)
+
+
+def _execution_queries(queries: list[QueryIn]) -> list[query_format.ExecutionQuery]:
+    parsed = [query_format.parse_query(q.identifier, q.content) for q in queries]
+    return query_format.to_execution_queries(parsed)
+
+
+def _pgbench_queries(queries: list[QueryIn]) -> list[dict]:
+    parsed = [query_format.parse_query(q.identifier, q.content) for q in queries]
+    return query_format.to_pgbench_queries(parsed)
 
 
 def _empty_report(concurrency: int, error: str) -> TestReportOut:
@@ -157,7 +214,7 @@ def _empty_report(concurrency: int, error: str) -> TestReportOut:
         p99_execution_time_ms=0.0,
         throughput_queries_per_second=0.0,
         total_duration_seconds=0.0,
-        connection_pool_metrics={"status": "not_initialized"},
+        connection_pool_metrics=PoolMetricsOut(status="not_initialized"),
         error=error,
     )
 
@@ -165,18 +222,27 @@ def _empty_report(concurrency: int, error: str) -> TestReportOut:
 # --------------------------------------------------------------------------- #
 # pgbench (Databricks Job)
 # --------------------------------------------------------------------------- #
+# pgbench's -M values. A Literal validates in pydantic-core and rejects anything else
+# before it reaches the job parameters or the local pgbench argv.
+PgbenchProtocol = Literal["simple", "extended", "prepared"]
+
+
 class PgbenchConfigIn(BaseModel):
+    model_config = _FROZEN
+
     clients: int = Field(default=8, ge=1, le=1000)
     jobs: int = Field(default=8, ge=1, le=100)
     duration_seconds: int = Field(default=30, ge=1, le=3600)
     progress_interval: int = Field(default=5, ge=1, le=60)
-    protocol: str = Field(default="prepared")
+    protocol: PgbenchProtocol = "prepared"
     per_statement_latency: bool = True
     detailed_logging: bool = True
     connect_per_transaction: bool = False
 
 
 class PgbenchSubmitIn(BaseModel):
+    model_config = _FROZEN
+
     auth_method: auth.AuthMethod = "identity"
     project: str | None = None
     database: str | None = None
@@ -188,7 +254,7 @@ class PgbenchSubmitIn(BaseModel):
     postgres_user_name: str | None = None
     # workload — same unified query format as psycopg (QueryIn)
     config: PgbenchConfigIn = Field(default_factory=PgbenchConfigIn)
-    queries: list[QueryIn] = Field(default_factory=list)
+    queries: list[QueryIn] = Field(default_factory=list, max_length=_MAX_QUERIES)
 
 
 class PgbenchSubmitOut(BaseModel):
@@ -227,28 +293,18 @@ def submit_pgbench_job(req: PgbenchSubmitIn, ws: EffectiveClient, request: Reque
     if not req.queries:
         return PgbenchSubmitOut(status="error", error="No queries provided.")
 
-    try:
-        creds = auth.resolve(
-            ws,
-            auth_method=req.auth_method,
-            project=req.project,
-            database=req.database,
-            endpoint_host=req.endpoint_host,
-            access_token=req.access_token,
-            postgres_user_name=req.postgres_user_name,
-        )
-    except Exception as e:  # noqa: BLE001
-        logger.info(f"pgbench auth resolution failed: {e}")
-        return PgbenchSubmitOut(status="error", error=f"Authentication failed: {e}")
-
     # Translate the unified query format into native pgbench scripts (\set + :name)
     # so the same query body the user wrote for psycopg drives pgbench unchanged.
+    # Done before resolving credentials so a malformed query fails fast.
     try:
-        parsed = [query_format.parse_query(q.identifier, q.content) for q in req.queries]
-        pgbench_queries = query_format.to_pgbench_queries(parsed)
+        pgbench_queries = _pgbench_queries(req.queries)
     except ValueError as e:
         return PgbenchSubmitOut(status="error", error=str(e))
 
+    creds = _resolve_creds(ws, req, "pgbench")
+    if isinstance(creds, str):
+        return PgbenchSubmitOut(status="error", error=creds)
+
     try:
         # SP orchestrates the job; user creds (above) run the workload.
         result = pgbench_job.submit(
@@ -261,7 +317,7 @@ def submit_pgbench_job(req: PgbenchSubmitIn, ws: EffectiveClient, request: Reque
         monitoring_url = lakebase_service.build_monitoring_url(ws, creds)
         return PgbenchSubmitOut(**result, monitoring_url=monitoring_url)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"pgbench job submission failed: {e}")
+        logger.info("pgbench job submission failed: %s", e)
         return PgbenchSubmitOut(status="error", error=str(e))
 
 
@@ -277,7 +333,7 @@ def get_pgbench_run_status(run_id: str, request: Request) -> PgbenchStatusOut:
     try:
         return PgbenchStatusOut(**pgbench_job.run_status(_app_sp(request), run_id))
     except Exception as e:  # noqa: BLE001
-        logger.info(f"pgbench status lookup failed: {e}")
+        logger.info("pgbench status lookup failed: %s", e)
         return PgbenchStatusOut(
             run_id=run_id, status="failed", message=str(e), progress=0, error=str(e)
         )
@@ -305,9 +361,21 @@ class PgbenchLocalSubmitOut(BaseModel):
     response_model=CapabilitiesOut,
     operation_id="getTestingCapabilities",
 )
-def get_testing_capabilities() -> CapabilitiesOut:
+def get_testing_capabilities(request: Request) -> Response:
     """Report optional, environment-gated testing capabilities."""
-    return CapabilitiesOut(pgbench_local_available=pgbench_local.local_available())
+    # Constant per process, so browsers may reuse it for a few minutes and then
+    # revalidate by ETag instead of refetching on every page that shows run modes.
+    return cached_json_response(request, _capabilities_body(), max_age=300)
+
+
+@lru_cache(maxsize=1)
+def _capabilities_body() -> bytes:
+    """The capabilities response, encoded once per process.
+
+    Both inputs (the Databricks App env markers and pgbench on PATH) are fixed for the
+    life of the process, and every page that offers a run mode fetches this.
+    """
+    return CapabilitiesOut(pgbench_local_available=pgbench_local.local_available()).model_dump_json().encode()
 
 
 @router.post(
@@ -324,25 +392,14 @@ def submit_local_pgbench(req: PgbenchSubmitIn, ws: EffectiveClient) -> PgbenchLo
         return PgbenchLocalSubmitOut(status="error", error="No queries provided.")
 
     try:
-        creds = auth.resolve(
-            ws,
-            auth_method=req.auth_method,
-            project=req.project,
-            database=req.database,
-            endpoint_host=req.endpoint_host,
-            access_token=req.access_token,
-            postgres_user_name=req.postgres_user_name,
-        )
-    except Exception as e:  # noqa: BLE001
-        logger.info(f"local pgbench auth resolution failed: {e}")
-        return PgbenchLocalSubmitOut(status="error", error=f"Authentication failed: {e}")
-
-    try:
-        parsed = [query_format.parse_query(q.identifier, q.content) for q in req.queries]
-        pgbench_queries = query_format.to_pgbench_queries(parsed)
+        pgbench_queries = _pgbench_queries(req.queries)
     except ValueError as e:
         return PgbenchLocalSubmitOut(status="error", error=str(e))
 
+    creds = _resolve_creds(ws, req, "local pgbench")
+    if isinstance(creds, str):
+        return PgbenchLocalSubmitOut(status="error", error=creds)
+
     try:
         result = pgbench_local.submit(
             creds=creds,
@@ -353,7 +410,7 @@ def submit_local_pgbench(req: PgbenchSubmitIn, ws: EffectiveClient) -> PgbenchLo
         monitoring_url = lakebase_service.build_monitoring_url(ws, creds)
         return PgbenchLocalSubmitOut(**result, monitoring_url=monitoring_url)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"local pgbench submission failed: {e}")
+        logger.info("local pgbench submission failed: %s", e)
         return PgbenchLocalSubmitOut(status="error", error=str(e))
 
 
@@ -10,18 +10,26 @@ OAuth-paste fallback).
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import os
 import re
+import threading
 import time
+from collections import defaultdict
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import repeat
 from typing import Any, Optional
 from urllib.parse import quote_plus
 
 import psycopg
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import QueuePool
 
+from ..core import logger
 from . import query_format
 from .lakebase_service import PgCredentials
 from .stats import percentile
@@ -46,6 +54,35 @@ def search_path_option(schema: Optional[str]) -> Optional[str]:
     return f"-c search_path={schema},public"
 
 
+# Engine settings that never vary per run, kept in one place.
+_ENGINE_STATIC_KWARGS: dict[str, Any] = {
+    "poolclass": QueuePool,
+    "pool_recycle": 3600,
+    # pre_ping adds a "SELECT 1" round-trip on every checkout, which both halves
+    # throughput and inflates measured query latency under load. Off for the
+    # benchmark; pool_recycle still guards stale connections.
+    "pool_pre_ping": False,
+    "echo": False,
+}
+
+
+def _iter_tasks(
+    queries: list[query_format.ExecutionQuery], counts: list[int]
+) -> Iterator[tuple[str, str, dict[str, Any] | None]]:
+    """Yield one ``(identifier, sql, parameters)`` task per execution, lazily.
+
+    Parameters are drawn as each task is taken, so a run never holds more bind dicts
+    than it has executions in flight.
+    """
+    for q, count in zip(queries, counts):
+        if not q.params:
+            # No parameters: every execution is identical, so repeat one task.
+            yield from repeat((q.identifier, q.sql, None), count)
+            continue
+        for _ in range(count):
+            yield q.identifier, q.sql, q.draw()
+
+
 class ConnectionPool:
     """A SQLAlchemy engine (psycopg3) with a sized pool and a concurrent runner."""
 
@@ -54,6 +91,7 @@ class ConnectionPool:
         self._host: str = ""
         self._database: str = ""
         self._user: str = ""
+        self._password: str = ""
 
     def initialize(
         self,
@@ -72,6 +110,7 @@ class ConnectionPool:
         schema: Optional[str] = None,
     ) -> None:
         self._host, self._database, self._user = host, database, user
+        self._password = password
 
         # Set the connection default schema so unqualified table names resolve to the
         # chosen (e.g. synced) schema, alongside the per-statement timeout.
@@ -80,32 +119,49 @@ class ConnectionPool:
         if sp:
             options = f"{options} {sp}"
 
+        # The password (a short-lived OAuth token) is injected per connect from
+        # self._password rather than baked into the URL, so a reused pool opens new
+        # connections with the latest token (see set_password).
         url = (
-            f"postgresql+psycopg://{quote_plus(user)}:{quote_plus(password)}"
+            f"postgresql+psycopg://{quote_plus(user)}:"
             f"@{host}:{port}/{quote_plus(database)}?sslmode={ssl_mode}"
         )
         self._engine = create_engine(
             url,
-            poolclass=QueuePool,
             pool_size=base_pool_size,
             max_overflow=max_overflow,
             pool_timeout=pool_timeout,
-            pool_recycle=3600,
-            # pre_ping adds a "SELECT 1" round-trip on every checkout, which both
-            # halves throughput and inflates measured query latency under load.
-            # Off for the benchmark; pool_recycle still guards stale connections.
-            pool_pre_ping=False,
-            echo=False,
+            **_ENGINE_STATIC_KWARGS,
             connect_args={
                 # Fail fast on an unreachable host / DNS hang instead of blocking forever.
                 "connect_timeout": connect_timeout,
                 "options": options,
             },
         )
+        event.listen(self._engine, "do_connect", self._inject_password)
         # Validate connectivity up front so failures surface as a clear error.
         with self._engine.connect() as conn:
             conn.execute(text("SELECT 1")).fetchone()
 
+    def _inject_password(self, dialect, conn_rec, cargs, cparams) -> None:
+        cparams["password"] = self._password
+
+    def set_password(self, password: str) -> None:
+        """Use a freshly minted token for connections opened from now on. Already-open
+        connections stay authenticated (Postgres doesn't re-check a live session)."""
+        self._password = password
+
+    def ping(self) -> bool:
+        """Run ``SELECT 1`` through the pool; False when its connections are dead (e.g.
+        the endpoint scaled to zero while the pool sat warm)."""
+        try:
+            with self._connection() as conn:
+                conn.execute(text("SELECT 1")).fetchone()
+            return True
+        except Exception as e:  # noqa: BLE001
+            logger.info("Warm pool failed validation: %s", e)
+            return False
+
     @contextmanager
     def _connection(self):
         if not self._engine:
@@ -147,91 +203,82 @@ class ConnectionPool:
             }
 
     async def run_concurrent(
-        self, queries: list[dict[str, Any]], concurrency_level: int, total_executions: int
+        self,
+        queries: list[query_format.ExecutionQuery],
+        concurrency_level: int,
+        total_executions: int,
     ) -> dict[str, Any]:
         """Distribute ``total_executions`` across the queries by weight, expand each
         into that many executions (drawing a fresh random parameter dict per
         execution), run them with a concurrency cap, and aggregate metrics."""
-        counts = query_format.distribute_executions(
-            [int(qc.get("weight", 1)) for qc in queries], total_executions
-        )
-        tasks: list[dict[str, Any]] = []
-        for qc, count in zip(queries, counts):
-            sql_lines = [
-                ln for ln in qc["query_content"].split("\n")
-                if not ln.strip().startswith("--")
-            ]
-            clean_sql = "\n".join(sql_lines).strip()
-            param_specs = qc.get("param_specs") or []
-            for _ in range(count):
-                tasks.append(
-                    {
-                        "query_identifier": qc["query_identifier"],
-                        "query": clean_sql,
-                        "parameters": query_format.draw_from_specs(param_specs) or None,
-                    }
-                )
+        counts = query_format.distribute_executions([q.weight for q in queries], total_executions)
 
         # A dedicated executor sized to the concurrency level — asyncio's default
         # executor caps at min(32, cpus+4) threads, which would silently throttle the
         # run far below the requested concurrency (e.g. only ~8 in flight on a 4-core
-        # box). The semaphore then just bounds how many tasks are queued at once.
+        # box). A fixed set of ``concurrency`` workers then pulls executions from one
+        # lazy task stream, so neither the task list nor a coroutine per execution is
+        # materialized up front — memory stays flat however large total_executions is.
         concurrency = max(1, concurrency_level)
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="lakebench")
-        semaphore = asyncio.Semaphore(concurrency)
+        tasks = _iter_tasks(queries, counts)
 
-        async def run_one(task: dict[str, Any]) -> dict[str, Any]:
-            async with semaphore:
-                res = await loop.run_in_executor(
-                    executor, self._execute_sync, task["query"], task["parameters"]
-                )
-                res["query_identifier"] = task["query_identifier"]
-                return res
+        # Results are folded into these aggregates as they arrive instead of being
+        # kept per execution: the report only needs counts, per-query successful
+        # latencies and the first error, so memory holds one float per success rather
+        # than a result dict per execution. Workers all run on the event loop, so the
+        # updates need no locking.
+        successful = 0
+        failed = 0
+        # Keep the first failure's message so the UI can show *why* a run failed
+        # instead of just a 0% success rate (otherwise failures are silent).
+        sample_error: str | None = None
+        groups: dict[str, dict[str, Any]] = defaultdict(lambda: {"calls": 0, "lat": []})
+
+        async def worker() -> None:
+            nonlocal successful, failed, sample_error
+            # Workers share the iterator; next() never interleaves on one event loop.
+            for identifier, sql, parameters in tasks:
+                try:
+                    res = await loop.run_in_executor(executor, self._execute_sync, sql, parameters)
+                except Exception as e:  # noqa: BLE001 - counted as a failure
+                    failed += 1
+                    if sample_error is None:
+                        sample_error = f"{type(e).__name__}: {e}"
+                    continue
+                g = groups[identifier]
+                g["calls"] += 1
+                if res["success"]:
+                    successful += 1
+                    g["lat"].append(res["duration_ms"])
+                else:
+                    failed += 1
+                    if sample_error is None:
+                        etype = res.get("error_type")
+                        emsg = res.get("error_message") or "query failed"
+                        prefix = f"[{identifier}] " if identifier else ""
+                        sample_error = f"{prefix}{etype + ': ' if etype else ''}{emsg}"
 
         # Snapshot DB cache counters around the run so we can report cache hit % for
         # THIS run (a delta), instead of the misleading lifetime ratio that never
-        # recovers from the initial bulk load.
-        cache_before = self._cache_counters()
-        start = time.time()
+        # recovers from the initial bulk load. Each snapshot is a DB round trip, so it
+        # runs on the executor too rather than blocking the event loop.
         try:
-            results = await asyncio.gather(
-                *[run_one(t) for t in tasks], return_exceptions=True
-            )
+            cache_before = await loop.run_in_executor(executor, self._cache_counters)
+            start = time.time()
+            await asyncio.gather(*[worker() for _ in range(min(concurrency, sum(counts)))])
+            total_duration = time.time() - start
+            cache_after = await loop.run_in_executor(executor, self._cache_counters)
         finally:
             executor.shutdown(wait=False)
-        total_duration = time.time() - start
-        cache_after = self._cache_counters()
         cache_hit_pct = self._cache_hit_delta(cache_before, cache_after)
 
-        successful = 0
-        failed = 0
-        latencies: list[float] = []
-        # Keep the first failure's message so the UI can show *why* a run failed
-        # instead of just a 0% success rate (otherwise failures are silent).
-        sample_error: str | None = None
-        for r in results:
-            if isinstance(r, BaseException):
-                failed += 1
-                if sample_error is None:
-                    sample_error = f"{type(r).__name__}: {r}"
-            elif r.get("success"):
-                successful += 1
-                latencies.append(r["duration_ms"])
-            else:
-                failed += 1
-                if sample_error is None:
-                    etype = r.get("error_type")
-                    emsg = r.get("error_message") or "query failed"
-                    qid = r.get("query_identifier")
-                    prefix = f"[{qid}] " if qid else ""
-                    sample_error = f"{prefix}{etype + ': ' if etype else ''}{emsg}"
-
-        n = len(results)
+        n = successful + failed
+        latencies = sorted(lat for g in groups.values() for lat in g["lat"])
         success_rate = successful / n if n else 0.0
         avg = sum(latencies) / len(latencies) if latencies else 0.0
         throughput = n / total_duration if total_duration > 0 else 0.0
-        latencies.sort()
 
         def pct(p: float, vals: list[float]) -> float:
             return percentile(vals, p) if vals else 0.0
@@ -251,24 +298,14 @@ class ConnectionPool:
             "total_duration_seconds": total_duration,
             "cache_hit_pct": cache_hit_pct,
             "connection_pool_metrics": self.pool_status(),
-            "per_query": self._per_query_breakdown(results, pct),
+            "per_query": self._per_query_breakdown(groups, pct),
         }
 
     @staticmethod
-    def _per_query_breakdown(results: list[Any], pct: Any) -> list[dict[str, Any]]:
+    def _per_query_breakdown(groups: dict[str, dict[str, Any]], pct: Any) -> list[dict[str, Any]]:
         """Per-query (by identifier) calls/avg/total/p95/p99, like Lakebase's query
-        performance view. Sorted by total time descending."""
-        from collections import defaultdict
-
-        groups: dict[str, dict[str, Any]] = defaultdict(lambda: {"calls": 0, "lat": []})
-        for r in results:
-            if isinstance(r, BaseException):
-                continue
-            g = groups[r.get("query_identifier", "?")]
-            g["calls"] += 1
-            if r.get("success"):
-                g["lat"].append(r["duration_ms"])
-
+        performance view, from the run's per-query aggregates. Sorted by total time
+        descending."""
         out: list[dict[str, Any]] = []
         for q, g in groups.items():
             lat = sorted(g["lat"])
@@ -330,6 +367,188 @@ class ConnectionPool:
             self._engine = None
 
 
+# --------------------------------------------------------------------------- #
+# Warm pool registry: pools outlive a single test run, keyed by endpoint, identity
+# and pool shape, so a repeat run starts on already-open connections instead of
+# paying TCP+TLS+auth per connection again. A pool serves one run at a time, so a run's
+# latencies and pool metrics are its own; a concurrent run with the same key gets a
+# private pool that is closed when it finishes. Pools idle for longer than
+# _POOL_IDLE_SECONDS are disposed by a background sweep (running only while any pool is
+# registered) so they don't hold connections open (and keep the endpoint from scaling
+# to zero) after the last run; pools in use are never evicted.
+# --------------------------------------------------------------------------- #
+_POOL_IDLE_SECONDS = 600
+_POOL_SWEEP_SECONDS = 60
+_MAX_IDLE_POOLS = 8
+
+# Steady-state pool shape, deployment-configurable. The base size is a *floor*: a run
+# gets max(concurrency, floor) persistent slots, so nearby concurrency levels share one
+# warm pool (the registry keys on shape) instead of each building its own. QueuePool
+# opens connections lazily, so an unused slot costs nothing.
+_POOL_BASE_ENV = "LAKEBASE_POOL_BASE"
+_POOL_BASE_DEFAULT = 25
+_POOL_MAX_OVERFLOW_ENV = "LAKEBASE_POOL_MAX_OVERFLOW"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.info("connection pool: invalid %s=%r; using default %s", name, raw, default)
+        return default
+
+
+def pool_sizing(concurrency_level: int) -> tuple[int, int]:
+    """``(base_pool_size, max_overflow)`` for a run at ``concurrency_level``.
+
+    Base covers the concurrency level so each worker reuses a warm connection instead
+    of paying a TCP+TLS+auth handshake per query (QueuePool closes *overflow*
+    connections on return); a small overflow absorbs the cache-counter probes that run
+    alongside the workload.
+    """
+    base = max(concurrency_level, _env_int(_POOL_BASE_ENV, _POOL_BASE_DEFAULT), 1)
+    return base, _env_int(_POOL_MAX_OVERFLOW_ENV, max(2, base // 4))
+
+
+@dataclass
+class _PoolEntry:
+    pool: ConnectionPool
+    leased: bool = False
+    last_used: float = 0.0
+
+
+_POOLS_LOCK = threading.Lock()
+_POOLS: dict[tuple, _PoolEntry] = {}
+_SWEEPER: Optional[threading.Thread] = None
+
+
+def _evict_idle_locked() -> list[ConnectionPool]:
+    """Drop expired idle pools, then the least recently used beyond the cap (caller
+    holds _POOLS_LOCK). Returns the evicted pools for the caller to close unlocked."""
+    now = time.monotonic()
+    idle = sorted(
+        ((k, e) for k, e in _POOLS.items() if not e.leased), key=lambda ke: ke[1].last_used
+    )
+    excess = len(idle) - _MAX_IDLE_POOLS
+    evicted: list[ConnectionPool] = []
+    for i, (key, entry) in enumerate(idle):
+        if i < excess or now - entry.last_used > _POOL_IDLE_SECONDS:
+            del _POOLS[key]
+            evicted.append(entry.pool)
+    return evicted
+
+
+def _sweep_idle_pools() -> None:
+    """Background loop: close expired idle pools; exits once the registry is empty."""
+    global _SWEEPER
+    while True:
+        time.sleep(_POOL_SWEEP_SECONDS)
+        with _POOLS_LOCK:
+            evicted = _evict_idle_locked()
+            done = not _POOLS
+            if done:
+                _SWEEPER = None
+        for stale in evicted:
+            stale.close()
+        if done:
+            return
+
+
+def _ensure_sweeper_locked() -> None:
+    # Caller holds _POOLS_LOCK, so the sweeper's exit decision can't race this check.
+    global _SWEEPER
+    if _SWEEPER is None:
+        _SWEEPER = threading.Thread(
+            target=_sweep_idle_pools, name="lakebase-pool-sweeper", daemon=True
+        )
+        _SWEEPER.start()
+
+
+def acquire_pool(
+    creds: PgCredentials,
+    *,
+    base_pool_size: int,
+    max_overflow: int,
+    schema: Optional[str] = None,
+) -> ConnectionPool:
+    """Lease a warm pool for these credentials, creating (and validating) it on a miss.
+
+    The lease is exclusive: when the registered pool is already leased by another run,
+    a fresh unregistered pool is built instead (and closed on release). Every call must
+    be paired with :func:`release_pool`. A warm pool is pinged before it's handed out
+    and rebuilt when that fails. Raises like :meth:`ConnectionPool.initialize` when a
+    new pool can't connect.
+    """
+    # A pool's open connections are already authenticated as ``creds.user``, so a hit
+    # must not hand them to a caller who hasn't proven that identity. Server-minted
+    # (identity) credentials are the caller's own; pasted OAuth ones are keyed on a
+    # digest of the token too, so only the same token reaches the pool it validated.
+    proof = None if creds.minted else hashlib.sha256(creds.password.encode()).hexdigest()
+    key = (
+        creds.host, creds.port, creds.database, creds.user, creds.ssl_mode,
+        (schema or "").strip(), base_pool_size, max_overflow, proof,
+    )
+    with _POOLS_LOCK:
+        evicted = _evict_idle_locked()
+        entry = _POOLS.get(key)
+        if entry is not None and not entry.leased:
+            entry.leased = True
+            entry.pool.set_password(creds.password)
+        else:
+            entry = None
+    for stale in evicted:
+        stale.close()
+    if entry is not None:
+        # pool_pre_ping is off, so a pool left idle past the endpoint's suspend window
+        # would otherwise surface its dead connections as query failures mid-run.
+        if entry.pool.ping():
+            return entry.pool
+        with _POOLS_LOCK:
+            if _POOLS.get(key) is entry:
+                del _POOLS[key]
+        entry.pool.close()
+
+    pool = ConnectionPool()
+    try:
+        pool.initialize(
+            host=creds.host,
+            port=creds.port,
+            database=creds.database,
+            user=creds.user,
+            password=creds.password,
+            ssl_mode=creds.ssl_mode,
+            base_pool_size=base_pool_size,
+            max_overflow=max_overflow,
+            schema=schema,
+        )
+    except Exception:
+        pool.close()
+        raise
+
+    with _POOLS_LOCK:
+        if key not in _POOLS:
+            _POOLS[key] = _PoolEntry(pool, leased=True)
+    # Otherwise another run holds (or just registered) this key's pool: this one stays
+    # private to the caller and release_pool closes it.
+    return pool
+
+
+def release_pool(pool: ConnectionPool) -> None:
+    """Return a pool leased by :func:`acquire_pool`, keeping it warm for the next run."""
+    with _POOLS_LOCK:
+        for entry in _POOLS.values():
+            if entry.pool is pool:
+                entry.leased = False
+                entry.last_used = time.monotonic()
+                _ensure_sweeper_locked()
+                return
+    # A private pool built while the registered one was leased — don't leak it.
+    pool.close()
+
+
 # --------------------------------------------------------------------------- #
 # Shared cache-hit helpers (psycopg pool uses the methods above; pgbench, which
 # doesn't use the pool, uses these standalone functions).
@@ -18,9 +18,12 @@ discounts or the Lakebase compute promotion, so treat them as an upper-bound est
 
 from __future__ import annotations
 
+import random
 import re
+import threading
 import time
 from dataclasses import dataclass, field
+from string import Template
 
 from databricks.sdk import WorkspaceClient
 
@@ -36,7 +39,7 @@ DBU_PER_CU_HOUR = 0.213
 DEFAULT_PRICE_PER_CU_HOUR = 0.111
 
 
-@dataclass
+@dataclass(slots=True)
 class CostDay:
     usage_date: str
     compute_dbus: float
@@ -59,14 +62,15 @@ class CostReport:
     total_cost: float = 0.0
 
 
-def _cost_query(project_uid: str, days: int) -> str:
-    # project_uid is regex-validated and days is an int, so both are safe to
-    # interpolate. Single pass over system.billing.usage with conditional
-    # aggregation (compute vs storage keyed off sku_name) — half the scan of
-    # separate CTEs. LEFT JOIN keeps usage rows even if a SKU has no current list
-    # price. Cost = SUM(usage * list_price) so multiple regional SKUs roll up
-    # correctly. Column order must match the parser in get_lakebase_cost.
-    return f"""
+# Built once at import; each call only substitutes the two validated values.
+# project_uid is regex-validated and days is an int, so both are safe to
+# interpolate. Single pass over system.billing.usage with conditional
+# aggregation (compute vs storage keyed off sku_name) — half the scan of
+# separate CTEs. LEFT JOIN keeps usage rows even if a SKU has no current list
+# price. Cost = SUM(usage * list_price) so multiple regional SKUs roll up
+# correctly. Column order must match the parser in get_lakebase_cost.
+_COST_QUERY = Template(
+    """
 SELECT CAST(u.usage_date AS STRING) AS usage_date,
        ROUND(SUM(CASE WHEN u.sku_name ILIKE '%_DATABASE_SERVERLESS_COMPUTE_%' THEN u.usage_quantity ELSE 0 END), 4) AS compute_dbus,
        ROUND(SUM(CASE WHEN u.sku_name ILIKE '%_DATABASE_SERVERLESS_COMPUTE_%' THEN u.usage_quantity * COALESCE(p.pricing.default, 0) ELSE 0 END), 2) AS compute_cost,
@@ -80,11 +84,16 @@ FROM system.billing.usage u
 LEFT JOIN system.billing.list_prices p
   ON u.sku_name = p.sku_name AND p.price_end_time IS NULL
 WHERE u.billing_origin_product = 'LAKEBASE'
-  AND u.usage_metadata.project_id = '{project_uid}'
-  AND u.usage_date >= current_date() - INTERVAL {days} DAYS
+  AND u.usage_metadata.project_id = '$project_uid'
+  AND u.usage_date >= current_date() - INTERVAL $days DAYS
 GROUP BY u.usage_date
 ORDER BY usage_date
 """.strip()
+)
+
+
+def _cost_query(project_uid: str, days: int) -> str:
+    return _COST_QUERY.substitute(project_uid=project_uid, days=days)
 
 
 def _f(v: object) -> float:
@@ -95,6 +104,11 @@ def _f(v: object) -> float:
         return 0.0
 
 
+# Statement polling backoff bounds (seconds) for _run_sql.
+_POLL_INITIAL_DELAY_S = 1.0
+_POLL_MAX_DELAY_S = 10.0
+
+
 def _run_sql(
     ws: WorkspaceClient, statement: str, warehouse_id: str, max_wait_s: int = 180
 ) -> list[list]:
@@ -109,6 +123,7 @@ def _run_sql(
         statement=statement, warehouse_id=warehouse_id, wait_timeout="30s"
     )
     deadline = time.monotonic() + max_wait_s
+    delay = _POLL_INITIAL_DELAY_S
     while True:
         state = str(resp.status.state) if resp.status and resp.status.state else "UNKNOWN"
         if "SUCCEEDED" in state:
@@ -119,7 +134,12 @@ def _run_sql(
         statement_id = resp.statement_id
         if not statement_id or time.monotonic() > deadline:
             raise RuntimeError(f"Billing query timed out after {max_wait_s}s (state {state}).")
-        time.sleep(2)
+        # Back off (with a little jitter so concurrent callers don't poll in lockstep):
+        # a statement still running after the 30s inline wait is usually a warehouse
+        # cold start, where fast early polls catch a quick finish and slower later ones
+        # avoid hammering the statement API for minutes.
+        time.sleep(delay + random.uniform(0, delay * 0.1))
+        delay = min(delay * 1.5, _POLL_MAX_DELAY_S)
         resp = ws.statement_execution.get_statement(statement_id=statement_id)
 
 
@@ -168,6 +188,18 @@ def _normalized(cost: float, total_queries: int) -> tuple[float | None, float |
     return (round(cpm, 4) if cpm is not None else None, round(qpd, 0))
 
 
+# A project's compute SKU (its region) never changes and list prices change rarely,
+# so a resolved price is reused for a while instead of re-running the billing join
+# (a warehouse round trip of seconds) for every run whose cost is shown.
+_PRICE_TTL_SECONDS = 3600.0
+_PRICE_LOCK = threading.Lock()
+_PRICES: dict[tuple[str, str], tuple[float, float]] = {}
+# A fixed set of locks striped by key, so concurrent requests for the same price
+# (e.g. a history table rendering cost for several runs at once) share a single
+# lookup without keeping a lock alive for every project ever priced.
+_PRICE_KEY_LOCKS: tuple[threading.Lock, ...] = tuple(threading.Lock() for _ in range(16))
+
+
 def compute_price_per_cu_hour(
     ws: WorkspaceClient, project_uid: str, warehouse_id: str
 ) -> tuple[float, str]:
@@ -175,8 +207,30 @@ def compute_price_per_cu_hour(
 
     Reads the most recent compute usage row for the project to pick the right
     regional SKU, joined to its current list price. Falls back to the AWS us-east-1
-    list price when the project has no compute history yet.
+    list price when the project has no compute history yet. Resolved list prices are
+    cached per workspace and project for :data:`_PRICE_TTL_SECONDS`; the fallback is
+    not, so a project's first usage row is picked up as soon as it lands.
     """
+    key = (getattr(ws.config, "host", None) or "", project_uid)
+    with _PRICE_KEY_LOCKS[hash(key) % len(_PRICE_KEY_LOCKS)]:
+        with _PRICE_LOCK:
+            hit = _PRICES.get(key)
+        if hit is not None and time.monotonic() - hit[0] < _PRICE_TTL_SECONDS:
+            return hit[1], "list_prices"
+        price = _query_price_per_cu_hour(ws, project_uid, warehouse_id)
+        if price is None:
+            return DEFAULT_PRICE_PER_CU_HOUR, "default"
+        now = time.monotonic()
+        with _PRICE_LOCK:
+            # Drop expired entries so the cache only holds recently priced projects.
+            for k in [k for k, (ts, _) in _PRICES.items() if now - ts >= _PRICE_TTL_SECONDS]:
+                del _PRICES[k]
+            _PRICES[key] = (now, price)
+        return price, "list_prices"
+
+
+def _query_price_per_cu_hour(ws: WorkspaceClient, project_uid: str, warehouse_id: str) -> float | None:
+    """The billing-table lookup behind :func:`compute_price_per_cu_hour`."""
     stmt = f"""
 SELECT p.pricing.default AS price_per_dbu
 FROM system.billing.usage u
@@ -190,8 +244,8 @@ LIMIT 1
 """.strip()
     rows = _run_sql(ws, stmt, warehouse_id)
     if rows and rows[0] and rows[0][0] is not None:
-        return round(_f(rows[0][0]) * DBU_PER_CU_HOUR, 6), "list_prices"
-    return DEFAULT_PRICE_PER_CU_HOUR, "default"
+        return round(_f(rows[0][0]) * DBU_PER_CU_HOUR, 6)
+    return None
 
 
 def estimate_run_cost(
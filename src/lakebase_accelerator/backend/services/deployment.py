@@ -8,7 +8,10 @@ verified path.
 
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -24,20 +27,48 @@ SchedulingPolicy = pg.SyncedTableSyncedTableSpecSyncedTableSchedulingPolicy
 _TABLE_NAME_RE = re.compile(r"^[A-Za-z0-9_]+\.[A-Za-z0-9_]+\.[A-Za-z0-9_]+$")
 
 
-@dataclass
+@dataclass(slots=True)
 class WarehouseInfo:
     id: str
     name: str
     state: Optional[str]
 
 
+# The warehouse picker is fetched on every Deployment/Cost page load; a short-lived
+# per-caller cache spares the paginated list round trip on revisits while still
+# picking up a warehouse starting or stopping within a minute.
+_WAREHOUSES_TTL_SECONDS = 30.0
+_WAREHOUSES_LOCK = threading.Lock()
+_WAREHOUSES: dict[tuple[str, str], tuple[float, list[WarehouseInfo]]] = {}
+
+
+def _caller_key(ws: WorkspaceClient) -> tuple[str, str]:
+    """(host, credential digest) — visibility is per caller, so cache per caller too.
+    The credential is hashed so the cache never holds a raw token."""
+    cfg = ws.config
+    cred = getattr(cfg, "token", None) or getattr(cfg, "client_id", None) or ""
+    return cfg.host or "", hashlib.sha256(cred.encode()).hexdigest()
+
+
 def list_warehouses(ws: WorkspaceClient) -> list[WarehouseInfo]:
     """List SQL warehouses the caller can access (used to run the CDF check)."""
+    key = _caller_key(ws)
+    now = time.monotonic()
+    with _WAREHOUSES_LOCK:
+        hit = _WAREHOUSES.get(key)
+    if hit is not None and now - hit[0] < _WAREHOUSES_TTL_SECONDS:
+        return list(hit[1])
+
     out: list[WarehouseInfo] = []
     for w in ws.warehouses.list():
         if w.id:
             out.append(WarehouseInfo(id=w.id, name=w.name or w.id, state=str(w.state) if w.state else None))
-    return out
+    with _WAREHOUSES_LOCK:
+        # Drop expired entries so rotating OBO tokens don't accumulate.
+        for k in [k for k, (ts, _) in _WAREHOUSES.items() if now - ts >= _WAREHOUSES_TTL_SECONDS]:
+            del _WAREHOUSES[k]
+        _WAREHOUSES[key] = (now, out)
+    return list(out)
 
 
 def _cdf_enabled_via_warehouse(ws: WorkspaceClient, warehouse_id: str, table: str) -> bool:
@@ -118,7 +149,7 @@ def get_table_uncompressed_size(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointInfo:
     name: str
     endpoint_type: Optional[str]
@@ -313,8 +344,12 @@ def create_synced_table(
 ) -> str:
     """Create a synced (reverse-ETL) table from a Delta source into Lakebase.
 
-    Returns the synced table's resource name. ``scheduling_policy`` must be one of
-    SNAPSHOT / TRIGGERED / CONTINUOUS.
+    Returns the synced table's name once the create is accepted, without waiting on
+    the long-running operation: provisioning the sync pipeline and the initial
+    snapshot takes minutes, and blocking a worker thread on it serialized the UI's
+    "Create all" fan-out behind the slowest table. Progress (and any asynchronous
+    failure) is read back via :func:`get_synced_table_status`. ``scheduling_policy``
+    must be one of SNAPSHOT / TRIGGERED / CONTINUOUS.
 
     ``storage_catalog`` / ``storage_schema`` are optional for Lakebase Autoscaling:
     when omitted, the platform auto-manages the sync pipeline's staging storage. They
@@ -338,12 +373,11 @@ def create_synced_table(
         create_database_objects_if_missing=True,
         new_pipeline_spec=new_pipeline_spec,
     )
-    op = ws.postgres.create_synced_table(
+    ws.postgres.create_synced_table(
         synced_table=pg.SyncedTable(spec=spec),
         synced_table_id=target_uc_name,
     )
-    result = op.wait()
-    return result.name or target_uc_name
+    return target_uc_name
 
 
 # Map the raw SyncedTableState enum to a compact status bucket the UI can color:
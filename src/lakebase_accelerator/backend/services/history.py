@@ -248,22 +248,25 @@ def save_runs(
     server-generated id (plain insert, no dedup).
     """
     qualified = _qualified(schema, table)
-    written = 0
+    if not runs:
+        return 0
+    # One executemany instead of an execute per run: psycopg pipelines the batch, so
+    # archiving a session costs one network round trip rather than one per run.
     with _connect(creds, autocommit=True) as conn, conn.cursor() as cur:
-        for run in runs:
-            cur.execute(
-                f"INSERT INTO {qualified} "  # noqa: S608
-                "(id, created_at, engine, label, project, config, queries, "
-                "baseline_report, optimized_report, index_ddls, created_by) "
-                "VALUES (COALESCE(%s::uuid, gen_random_uuid()), COALESCE(%s, now()), "
-                "%s, %s, %s, %s, %s, %s, %s, %s, %s) "
-                "ON CONFLICT (id) DO UPDATE SET "
-                "created_at = EXCLUDED.created_at, engine = EXCLUDED.engine, "
-                "label = EXCLUDED.label, project = EXCLUDED.project, "
-                "config = EXCLUDED.config, queries = EXCLUDED.queries, "
-                "baseline_report = EXCLUDED.baseline_report, "
-                "optimized_report = EXCLUDED.optimized_report, "
-                "index_ddls = EXCLUDED.index_ddls, created_by = EXCLUDED.created_by",
+        cur.executemany(
+            f"INSERT INTO {qualified} "  # noqa: S608
+            "(id, created_at, engine, label, project, config, queries, "
+            "baseline_report, optimized_report, index_ddls, created_by) "
+            "VALUES (COALESCE(%s::uuid, gen_random_uuid()), COALESCE(%s, now()), "
+            "%s, %s, %s, %s, %s, %s, %s, %s, %s) "
+            "ON CONFLICT (id) DO UPDATE SET "
+            "created_at = EXCLUDED.created_at, engine = EXCLUDED.engine, "
+            "label = EXCLUDED.label, project = EXCLUDED.project, "
+            "config = EXCLUDED.config, queries = EXCLUDED.queries, "
+            "baseline_report = EXCLUDED.baseline_report, "
+            "optimized_report = EXCLUDED.optimized_report, "
+            "index_ddls = EXCLUDED.index_ddls, created_by = EXCLUDED.created_by",
+            [
                 (
                     _uuid_or_none(run.get("id")),
                     run.get("created_at"),
@@ -276,10 +279,11 @@ def save_runs(
                     Json(run["optimized_report"]) if run.get("optimized_report") is not None else None,
                     Json(run.get("index_ddls") or []),
                     created_by,
-                ),
-            )
-            written += 1
-    return written
+                )
+                for run in runs
+            ],
+        )
+    return len(runs)
 
 
 def list_runs(creds: PgCredentials, schema: str, table: str = DEFAULT_TABLE, limit: int = 200) -> list[dict[str, Any]]:
@@ -9,10 +9,17 @@ pinned SDK (>=0.74) always exposes ``w.postgres``.
 
 from __future__ import annotations
 
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
+import psycopg
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.iam import User
+from databricks.sdk.service.postgres import Project
 
 
 def _is_not_found(e: Exception) -> bool:
@@ -34,6 +41,48 @@ class PgCredentials:
     project_id: Optional[str] = None
     branch_id: Optional[str] = None
     endpoint_id: Optional[str] = None
+    # True when the server minted ``password`` itself for the caller's own identity
+    # (identity auth). Pasted OAuth credentials are unverified until a connect succeeds.
+    minted: bool = False
+
+
+@lru_cache(maxsize=64)
+def normalize_workspace_url(host: str) -> str:
+    """Canonical ``https://<host>`` form of a workspace URL, without a trailing slash.
+
+    Memoized: a process only ever talks to a handful of workspaces, and this runs on
+    every deep-link / job-URL build.
+    """
+    host = host.rstrip("/")
+    return host if host.startswith(("https://", "http://")) else f"https://{host}"
+
+
+# ``current_user.me()`` per client. A client's identity never changes: the SP client
+# lives for the process and OBO clients are reused per forwarded token (see
+# ``deps._obo_client``). Weakly keyed, so a client evicted from that LRU drops its
+# entry here too.
+_ME: weakref.WeakKeyDictionary[WorkspaceClient, User] = weakref.WeakKeyDictionary()
+_ME_LOCK = threading.Lock()
+
+
+def _cached_user(ws: WorkspaceClient) -> Optional[User]:
+    with _ME_LOCK:
+        return _ME.get(ws)
+
+
+def get_current_user(ws: WorkspaceClient) -> User:
+    """``ws.current_user.me()``, fetched once per client instead of once per call."""
+    me = _cached_user(ws)
+    if me is None:
+        me = ws.current_user.me()
+        with _ME_LOCK:
+            _ME[ws] = me
+    return me
+
+
+# Workspace (org) id by normalized workspace URL. It never changes for a workspace, but
+# ``get_workspace_id()`` is an uncached SCIM round trip on every call.
+_WORKSPACE_IDS: dict[str, int] = {}
 
 
 def build_monitoring_url(ws: WorkspaceClient, creds: PgCredentials) -> Optional[str]:
@@ -46,22 +95,24 @@ def build_monitoring_url(ws: WorkspaceClient, creds: PgCredentials) -> Optional[
     host = getattr(ws.config, "host", None)
     if not (host and creds.project_id and creds.branch_id and creds.endpoint_id):
         return None
-    base = host.rstrip("/")
+    base = normalize_workspace_url(host)
     url = (
         f"{base}/lakebase/projects/{creds.project_id}"
         f"/branches/{creds.branch_id}/monitoring/query-history"
         f"?database={creds.database}&endpointId={creds.endpoint_id}"
     )
-    try:
-        workspace_id = ws.get_workspace_id()
-    except Exception:  # noqa: BLE001 - org param is best-effort
-        workspace_id = None
+    workspace_id = _WORKSPACE_IDS.get(base)
+    if workspace_id is None:
+        try:
+            workspace_id = _WORKSPACE_IDS[base] = ws.get_workspace_id()
+        except Exception:  # noqa: BLE001 - org param is best-effort
+            workspace_id = None
     if workspace_id:
         url += f"&o={workspace_id}"
     return url
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectInfo:
     name: str          # display name when present, else project id (use as the handle)
     id: Optional[str]
@@ -94,14 +145,17 @@ def list_projects(ws: WorkspaceClient) -> list[ProjectInfo]:
     return projects
 
 
-def _resolve_project_name(ws: WorkspaceClient, project: str) -> str:
-    """Resolve a project handle (id, ``projects/<id>``, or display name) to its
-    full resource name ``projects/<id>``."""
+def _resolve_project(ws: WorkspaceClient, project: str) -> Project:
+    """Resolve a project handle (id, ``projects/<id>``, or display name) to the project
+    itself, whose ``name`` is the full resource name ``projects/<id>``.
+
+    Returned whole so callers that also need its ``uid`` don't fetch it a second time.
+    """
     full = project if project.startswith("projects/") else f"projects/{project}"
     try:
         resolved = ws.postgres.get_project(name=full)
         if resolved and resolved.name:
-            return resolved.name
+            return resolved
     except Exception as e:
         if not _is_not_found(e):
             raise
@@ -110,37 +164,70 @@ def _resolve_project_name(ws: WorkspaceClient, project: str) -> str:
         spec = getattr(p, "spec", None)
         if spec and getattr(spec, "display_name", None) == project:
             if p.name:
-                return p.name
+                return p
     raise ValueError(
         f"Lakebase project not found: '{project}'. "
         "Use the project ID from the URL or the project's display name."
     )
 
 
+def _resolve_project_name(ws: WorkspaceClient, project: str) -> str:
+    """Resolve a project handle to its full resource name ``projects/<id>``."""
+    return _resolve_project(ws, project).name or ""
+
+
+def _project_uid(ws: WorkspaceClient, project: Project) -> Optional[str]:
+    # A project matched from the listing may come back without its uid; only then is
+    # it read again.
+    uid = getattr(project, "uid", None)
+    if uid or not project.name:
+        return uid
+    return getattr(ws.postgres.get_project(name=project.name), "uid", None)
+
+
 def resolve_project_uid(ws: WorkspaceClient, project: str) -> str:
     """Resolve a project handle to its physical ``uid`` (a UUID).
 
     ``system.billing.usage`` keys Lakebase rows on ``usage_metadata.project_id``,
     which is the project's physical uid — not the logical resource-name segment.
     """
-    project_name = _resolve_project_name(ws, project)
-    uid = getattr(ws.postgres.get_project(name=project_name), "uid", None)
+    uid = _project_uid(ws, _resolve_project(ws, project))
     if not uid:
         raise ValueError(f"Could not resolve a uid for project '{project}'.")
     return uid
 
 
+# Endpoint states that can take a connection right away (IDLE wakes on connect).
+_SERVING_STATES = frozenset({"ACTIVE", "IDLE"})
+
+
 def resolve_credentials(
     ws: WorkspaceClient, project: str, database: Optional[str] = None
 ) -> PgCredentials:
     """Resolve connection credentials for a project's primary endpoint:
     pick an active/idle read-write endpoint, read its host, and mint a short-lived
-    OAuth token via ``generate_database_credential``."""
+    OAuth token via ``generate_database_credential``.
+
+    The Postgres role name (:func:`get_current_user`) doesn't depend on the
+    project → branch → endpoint → credential chain, so on a client's first call it is
+    fetched on a side thread while that chain runs instead of adding one more serial
+    round trip. Once memoized it is read directly, with no thread.
+    """
+    me: Future[User]
+    cached = _cached_user(ws)
+    if cached is None:
+        pool = ThreadPoolExecutor(max_workers=1)
+        me = pool.submit(get_current_user, ws)
+        pool.shutdown(wait=False)  # the submitted lookup still runs; nothing else queues
+    else:
+        me = Future()
+        me.set_result(cached)
     pg = ws.postgres
-    project_name = _resolve_project_name(ws, project)
+    resolved = _resolve_project(ws, project)
+    project_name = resolved.name or ""
     # The Monitoring deep link is keyed by the objects' physical ``uid``s, not the
     # logical resource-name segments (e.g. project uid "4cc8…" not "my-app").
-    project_uid = getattr(pg.get_project(name=project_name), "uid", None)
+    project_uid = _project_uid(ws, resolved)
 
     branches = list(pg.list_branches(parent=project_name))
     if not branches:
@@ -154,23 +241,22 @@ def resolve_credentials(
     if not endpoints:
         raise ValueError(f"No endpoints found in branch {branch_name}")
 
+    # One pass: the first active/idle endpoint with a host wins (its host read in the
+    # same walk), else fall back to the first endpoint.
     endpoint = None
+    host = None
     for ep in endpoints:
-        status = getattr(ep, "status", None)
-        hosts = getattr(status, "hosts", None) if status else None
-        if hosts and getattr(hosts, "host", None):
+        status = ep.status
+        host = status.hosts.host if status and status.hosts else None
+        if host:
             state = getattr(status, "current_state", None)
-            if state and str(state).upper() in ("ACTIVE", "IDLE"):
+            if str(getattr(state, "value", state)).upper() in _SERVING_STATES:
                 endpoint = ep
                 break
     if endpoint is None:
         endpoint = endpoints[0]
-
-    host = None
-    if endpoint.status and endpoint.status.hosts:
-        host = getattr(endpoint.status.hosts, "host", None) or getattr(
-            endpoint.status.hosts, "read_only_host", None
-        )
+        hosts = endpoint.status.hosts if endpoint.status else None
+        host = (hosts.host or getattr(hosts, "read_only_host", None)) if hosts else None
     if not host:
         raise ValueError(
             f"Endpoint {endpoint.name} has no host; it may still be initializing."
@@ -183,7 +269,7 @@ def resolve_credentials(
     if not token:
         raise ValueError("Failed to obtain OAuth token for Lakebase Autoscaling.")
 
-    user_name = ws.current_user.me().user_name
+    user_name = me.result().user_name
     if not user_name:
         raise ValueError("Could not resolve the current user's Postgres role name.")
 
@@ -197,14 +283,13 @@ def resolve_credentials(
         project_id=project_uid,
         branch_id=getattr(branch, "uid", None),
         endpoint_id=getattr(endpoint, "uid", None),
+        minted=True,
     )
 
 
 def list_databases(ws: WorkspaceClient, project: str) -> list[str]:
     """List non-template databases in a project by connecting and querying
     ``pg_database`` with freshly-resolved credentials."""
-    import psycopg
-
     creds = resolve_credentials(ws, project)
     with psycopg.connect(
         host=creds.host,
@@ -241,8 +326,6 @@ def list_schemas(
 ) -> list[str]:
     """List non-system schemas in ``database`` (used to populate the default-schema
     picker so unqualified queries resolve to the right, e.g. synced, schema)."""
-    import psycopg
-
     creds = resolve_credentials(ws, project, database)
     with psycopg.connect(
         host=creds.host,
@@ -27,7 +27,7 @@ _IDENT = r'[a-zA-Z_][a-zA-Z0-9_$]*'
 _QUALIFIED = rf'(?:{_IDENT}\.)*{_IDENT}'
 
 
-@dataclass
+@dataclass(slots=True)
 class IndexSuggestion:
     table: str
     columns: list[str]
@@ -35,10 +35,16 @@ class IndexSuggestion:
     ddl: str
 
 
+# A whole ``--`` comment line (leading whitespace allowed) plus its newline.
+_COMMENT_LINE_RE = re.compile(r'^[^\S\n]*--[^\n]*\n?', re.MULTILINE)
+
+
 def _strip_comments(sql: str) -> str:
-    return "\n".join(
-        ln for ln in sql.split("\n") if not ln.strip().startswith("--")
-    ).strip()
+    # One regex pass over the text instead of splitting it into lines, testing each
+    # and joining the survivors back up.
+    if "--" not in sql:
+        return sql.strip()
+    return _COMMENT_LINE_RE.sub("", sql).strip()
 
 
 def _first_table(sql: str) -> Optional[str]:
@@ -51,7 +57,7 @@ def _first_table(sql: str) -> Optional[str]:
 
 def _bare(col: str) -> str:
     """Return the unqualified column name (drop table alias prefix)."""
-    return col.split(".")[-1]
+    return col.rpartition(".")[2]
 
 
 def _index_name(table: str, columns: list[str]) -> str:
@@ -252,7 +258,45 @@ _EXISTING_INDEXES_SQL = (
 )
 
 
-@dataclass
+# The catalog/statistics probes every introspection runs, sent as one multi-statement
+# round trip (no bind params, so psycopg can batch them). pg_stat_statements stays a
+# separate query: the extension is often missing, and its failure would abort the batch.
+_CATALOG_PROBES = (
+    ("cache_hit", _CACHE_HIT_SQL),
+    ("seq_scan", _SEQ_SCAN_SQL),
+    ("unused_idx", _UNUSED_IDX_SQL),
+    ("existing_indexes", _EXISTING_INDEXES_SQL),
+)
+_CATALOG_PROBES_SQL = " ".join(sql for _key, sql in _CATALOG_PROBES)
+
+
+def _run_catalog_probes(conn: psycopg.Connection, cur: psycopg.Cursor) -> dict[str, Optional[list]]:
+    """Rows per catalog probe, keyed as in ``_CATALOG_PROBES`` (None when a probe failed).
+
+    All probes go in one round trip; if the batch fails (e.g. a revoked stats view),
+    each is re-run on its own so one failing probe doesn't cost the others.
+    """
+    try:
+        cur.execute(_CATALOG_PROBES_SQL)
+        rows: dict[str, Optional[list]] = {}
+        for key, _sql in _CATALOG_PROBES:
+            rows[key] = cur.fetchall()
+            cur.nextset()
+        return rows
+    except Exception:  # noqa: BLE001
+        conn.rollback()
+    rows = {}
+    for key, sql in _CATALOG_PROBES:
+        try:
+            cur.execute(sql)
+            rows[key] = cur.fetchall()
+        except Exception:  # noqa: BLE001
+            conn.rollback()
+            rows[key] = None
+    return rows
+
+
+@dataclass(slots=True)
 class Finding:
     severity: str
     category: str
@@ -288,37 +332,34 @@ def live_introspection(
         options=search_path_option(schema) or "",
     ) as conn:
         with conn.cursor() as cur:
+            rows = _run_catalog_probes(conn, cur)
+
             # Cache hit ratio
-            try:
-                cur.execute(_CACHE_HIT_SQL)
-                row = cur.fetchone()
-                if row and row[0] is not None:
-                    pct = float(row[0])
-                    stats["cache_hit_pct"] = pct
-                    if pct < 99:
-                        findings.append(Finding(
-                            severity="low", category="cache",
-                            title="Lifetime cache hit ratio below 99%",
-                            detail=(
-                                f"Cache hit ratio is {pct:.2f}% — but this is the LIFETIME average "
-                                f"since stats were last reset, so a one-time bulk load/sync keeps it "
-                                f"low permanently. Use the per-run cache hit % in the test report to "
-                                f"judge steady-state performance."
-                            ),
-                            actions=[
-                                "Run the workload a few times to warm the cache, then read the per-run cache hit % in the test report.",
-                                "If steady-state stays low, raise the endpoint's min CU so the working set fits in RAM (~2 GB/CU).",
-                            ],
-                        ))
-            except Exception:  # noqa: BLE001
-                conn.rollback()
+            row = rows["cache_hit"][0] if rows["cache_hit"] else None
+            if row and row[0] is not None:
+                pct = float(row[0])
+                stats["cache_hit_pct"] = pct
+                if pct < 99:
+                    findings.append(Finding(
+                        severity="low", category="cache",
+                        title="Lifetime cache hit ratio below 99%",
+                        detail=(
+                            f"Cache hit ratio is {pct:.2f}% — but this is the LIFETIME average "
+                            f"since stats were last reset, so a one-time bulk load/sync keeps it "
+                            f"low permanently. Use the per-run cache hit % in the test report to "
+                            f"judge steady-state performance."
+                        ),
+                        actions=[
+                            "Run the workload a few times to warm the cache, then read the per-run cache hit % in the test report.",
+                            "If steady-state stays low, raise the endpoint's min CU so the working set fits in RAM (~2 GB/CU).",
+                        ],
+                    ))
 
             # Sequential scans (scoped to benchmark tables; never the history table)
-            try:
-                cur.execute(_SEQ_SCAN_SQL)
+            if rows["seq_scan"] is not None:
                 seq = [
                     {"table": r[0], "seq_scan": r[1], "idx_scan": r[2]}
-                    for r in cur.fetchall()
+                    for r in rows["seq_scan"]
                     if _keep_table(r[0], focus_tables)
                 ]
                 stats["seq_scan_tables"] = seq
@@ -333,15 +374,12 @@ def live_introspection(
                             "Run ANALYZE to refresh planner statistics.",
                         ],
                     ))
-            except Exception:  # noqa: BLE001
-                conn.rollback()
 
             # Unused indexes (scoped to benchmark tables; never the history table)
-            try:
-                cur.execute(_UNUSED_IDX_SQL)
+            if rows["unused_idx"] is not None:
                 unused = [
                     {"table": r[0], "index": r[1]}
-                    for r in cur.fetchall()
+                    for r in rows["unused_idx"]
                     if _keep_table(r[0], focus_tables)
                 ]
                 stats["unused_indexes"] = unused
@@ -352,17 +390,12 @@ def live_introspection(
                         detail=f"{len(unused)} index(es) have never been scanned; they slow writes.",
                         actions=["Drop indexes confirmed unused after a representative workload."],
                     ))
-            except Exception:  # noqa: BLE001
-                conn.rollback()
 
             # Existing indexes — used to drop already-satisfied suggestions
-            try:
-                cur.execute(_EXISTING_INDEXES_SQL)
+            if rows["existing_indexes"] is not None:
                 stats["existing_indexes"] = [
-                    {"table": r[0], "columns": list(r[1] or [])} for r in cur.fetchall()
+                    {"table": r[0], "columns": list(r[1] or [])} for r in rows["existing_indexes"]
                 ]
-            except Exception:  # noqa: BLE001
-                conn.rollback()
 
             # pg_stat_statements (optional extension)
             try:
@@ -420,7 +453,7 @@ def apply_indexes(
     return results
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplainResult:
     identifier: str
     plan: str
@@ -13,20 +13,24 @@ job runs under the caller's identity.
 
 from __future__ import annotations
 
-import base64
 import json
 import os
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.compute import ClusterSource, ListClustersFilterBy
 from databricks.sdk.service.workspace import ImportFormat
+from pydantic_core import from_json
 
 from ..core import logger
 from .connection import search_path_option
-from .lakebase_service import PgCredentials
+from .lakebase_service import PgCredentials, get_current_user, normalize_workspace_url
 
 # Bundled job payload (shipped as package data, see resources/pgbench/).
 _RESOURCES = Path(__file__).resolve().parent.parent / "resources" / "pgbench"
@@ -59,9 +63,11 @@ _CLUSTER_AUTOTERMINATION_ENV = "PGBENCH_CLUSTER_AUTOTERMINATION_MIN"
 _CLUSTER_AUTOTERMINATION_DEFAULT_MIN = 30
 
 
+@lru_cache(maxsize=1)
 def _cluster_autotermination_min() -> int:
     """Resolve the configured auto-termination window, clamped to Databricks' rules
-    (0 = never, otherwise a minimum of 10 minutes)."""
+    (0 = never, otherwise a minimum of 10 minutes). Deployment config, so resolved
+    (and any invalid value logged) once per process."""
     raw = os.environ.get(_CLUSTER_AUTOTERMINATION_ENV)
     if raw is None or not raw.strip():
         return _CLUSTER_AUTOTERMINATION_DEFAULT_MIN
@@ -69,8 +75,10 @@ def _cluster_autotermination_min() -> int:
         minutes = int(raw)
     except ValueError:
         logger.info(
-            f"pgbench cluster: invalid {_CLUSTER_AUTOTERMINATION_ENV}={raw!r}; "
-            f"using default {_CLUSTER_AUTOTERMINATION_DEFAULT_MIN}"
+            "pgbench cluster: invalid %s=%r; using default %s",
+            _CLUSTER_AUTOTERMINATION_ENV,
+            raw,
+            _CLUSTER_AUTOTERMINATION_DEFAULT_MIN,
         )
         return _CLUSTER_AUTOTERMINATION_DEFAULT_MIN
     if minutes <= 0:
@@ -88,12 +96,23 @@ _INLINE_QUERY_LIMIT = 8192
 # --------------------------------------------------------------------------- #
 def _detect_cloud(ws: WorkspaceClient) -> str:
     """Best-effort cloud detection from the workspace host ('aws' | 'azure' | 'gcp')."""
-    host = (getattr(ws.config, "host", "") or "").lower()
-    if "azuredatabricks.net" in host or "azure" in host:
-        return "azure"
-    if "gcp.databricks.com" in host:
-        return "gcp"
-    return "aws"
+    return _cloud_for_host(getattr(ws.config, "host", "") or "")
+
+
+# Host substring → cloud, checked in order; anything unmatched is AWS. "azure" also
+# covers "*.azuredatabricks.net".
+_CLOUD_PATTERNS = (
+    ("azure", "azure"),
+    ("gcp.databricks.com", "gcp"),
+)
+
+
+@lru_cache(maxsize=16)
+def _cloud_for_host(host: str) -> str:
+    # Memoized per host: a process talks to a handful of workspaces, and the cloud is
+    # consulted more than once per cluster spec.
+    host = host.lower()
+    return next((cloud for pattern, cloud in _CLOUD_PATTERNS if pattern in host), "aws")
 
 
 _INSTANCE_MAP = {
@@ -110,109 +129,182 @@ _INSTANCE_MAP = {
 # users, and guarantees the single-process pgbench load generator is never the bottleneck
 # (up to the UI's 1000-client / 100-thread ceiling) so measurements reflect Lakebase.
 _BENCHMARK_TIER = "2xlarge"
+# The tier is fixed, so the per-cloud node type is resolved once here.
+_BENCHMARK_NODE_TYPE = {cloud: tiers[_BENCHMARK_TIER] for cloud, tiers in _INSTANCE_MAP.items()}
 
 
-def _benchmark_node_type(ws: WorkspaceClient) -> str:
-    """Return the fixed max-tier single-node instance type for the detected cloud."""
-    cloud = _detect_cloud(ws)
-    node_type = _INSTANCE_MAP.get(cloud, _INSTANCE_MAP["aws"])[_BENCHMARK_TIER]
-    logger.info(f"pgbench cluster: node_type={node_type} (fixed {_BENCHMARK_TIER}) on {cloud}")
+def _benchmark_node_type(cloud: str) -> str:
+    """Return the fixed max-tier single-node instance type for ``cloud``."""
+    node_type = _BENCHMARK_NODE_TYPE.get(cloud) or _BENCHMARK_NODE_TYPE["aws"]
+    logger.debug("pgbench cluster: node_type=%s (fixed %s) on %s", node_type, _BENCHMARK_TIER, cloud)
     return node_type
 
 
-def _new_cluster_config(ws: WorkspaceClient, node_type: str, single_user: str, init_path: str) -> dict:
+# Static parts of the single-node cluster spec, built once; each spec gets shallow
+# copies so callers can still extend them (e.g. the benchmark cluster's extra tag).
+_SINGLE_NODE_SPARK_CONF = {
+    "spark.databricks.cluster.profile": "singleNode",
+    "spark.master": "local[*]",
+}
+_SINGLE_NODE_TAGS = {"ResourceClass": "SingleNode", "pgbench_job": "true"}
+# AWS 6th-gen Intel families have no local storage and need an EBS volume.
+_EBS_ONLY_FAMILIES = ("m6i", "r6i", "c6i", "m6a", "r6a", "c6a")
+_AWS_EBS_ATTRIBUTES = {
+    "ebs_volume_type": "GENERAL_PURPOSE_SSD",
+    "ebs_volume_count": 1,
+    "ebs_volume_size": 100,
+}
+
+
+def _new_cluster_config(cloud: str, node_type: str, single_user: str, init_path: str) -> dict:
     cfg: dict[str, Any] = {
         "spark_version": _SPARK_VERSION,
         "node_type_id": node_type,
         "num_workers": 0,
-        "spark_conf": {
-            "spark.databricks.cluster.profile": "singleNode",
-            "spark.master": "local[*]",
-        },
-        "custom_tags": {"ResourceClass": "SingleNode", "pgbench_job": "true"},
+        "spark_conf": dict(_SINGLE_NODE_SPARK_CONF),
+        "custom_tags": dict(_SINGLE_NODE_TAGS),
         "data_security_mode": "SINGLE_USER",
         "single_user_name": single_user,
         "init_scripts": [{"workspace": {"destination": init_path}}],
     }
-    # AWS 6th-gen Intel families have no local storage and need an EBS volume.
-    if _detect_cloud(ws) == "aws" and any(f in node_type for f in ("m6i", "r6i", "c6i", "m6a", "r6a", "c6a")):
-        cfg["aws_attributes"] = {
-            "ebs_volume_type": "GENERAL_PURPOSE_SSD",
-            "ebs_volume_count": 1,
-            "ebs_volume_size": 100,
-        }
+    if cloud == "aws" and any(f in node_type for f in _EBS_ONLY_FAMILIES):
+        cfg["aws_attributes"] = dict(_AWS_EBS_ATTRIBUTES)
     return cfg
 
 
 # --------------------------------------------------------------------------- #
 # Workspace asset upload
 # --------------------------------------------------------------------------- #
+# (workspace URL, path) pairs this process has already created, so the notebook and
+# init-script uploads don't each re-issue the same mkdirs.
+_ENSURED_DIRS: set[tuple[str, str]] = set()
+
+
 def _ensure_dir(ws: WorkspaceClient, path: str) -> None:
-    try:
-        ws.workspace.get_status(path)
-    except Exception:  # noqa: BLE001 - get_status raises when missing
-        ws.workspace.mkdirs(path)
+    # mkdirs is idempotent (like ``mkdir -p``), so a single call replaces the
+    # get_status probe: one round trip, and no check-then-create race between
+    # concurrent submissions.
+    key = (_workspace_url(ws), path)
+    if key in _ENSURED_DIRS:
+        return
+    ws.workspace.mkdirs(path)
+    _ENSURED_DIRS.add(key)
+
+
+@lru_cache(maxsize=None)
+def _bundled_asset(path: Path) -> bytes:
+    """Bytes of a bundled resource file. Package data doesn't change while the process
+    runs, so each file is read once."""
+    return path.read_bytes()
 
 
 def _upload_notebook(ws: WorkspaceClient) -> str:
     """Upload the bundled pgbench notebook (overwrite) and return its workspace path."""
     _ensure_dir(ws, _WS_DIR)
-    ws.workspace.upload(
-        path=_NOTEBOOK_WS_PATH,
-        content=_NOTEBOOK_LOCAL.read_bytes(),
-        format=ImportFormat.JUPYTER,
-        overwrite=True,
-    )
+    try:
+        ws.workspace.upload(
+            path=_NOTEBOOK_WS_PATH,
+            content=_bundled_asset(_NOTEBOOK_LOCAL),
+            format=ImportFormat.JUPYTER,
+            overwrite=True,
+        )
+    except Exception:
+        # The folder may have been deleted since it was ensured; recreate it next time.
+        _ENSURED_DIRS.discard((_workspace_url(ws), _WS_DIR))
+        raise
     return _NOTEBOOK_WS_PATH
 
 
+# Workspace URLs this process already uploaded the init script to. The bundled script
+# only changes with a redeploy (a new process), so the workspace copy stays current
+# unless something deletes it; a forced job rebuild clears this to re-upload.
+_INIT_SCRIPT_UPLOADED: set[str] = set()
+
+
 def _upload_init_script(ws: WorkspaceClient) -> str:
-    """Upload the bundled cluster init script (overwrite) and return its workspace path."""
+    """Upload the bundled cluster init script (overwrite) and return its workspace path.
+
+    Skipped when this process already uploaded it to this workspace.
+    """
+    key = _workspace_url(ws)
+    if key in _INIT_SCRIPT_UPLOADED:
+        return _INIT_SCRIPT_WS_PATH
     _ensure_dir(ws, _WS_DIR)
-    content_b64 = base64.b64encode(_INIT_SCRIPT_LOCAL.read_bytes()).decode("utf-8")
-    # AUTO format so Databricks stores it as a plain file, not a notebook.
-    ws.api_client.do(
-        "POST",
-        "/api/2.0/workspace/import",
-        body={"path": _INIT_SCRIPT_WS_PATH, "format": "AUTO", "content": content_b64, "overwrite": True},
-    )
+    # AUTO format so Databricks stores it as a plain file, not a notebook. The SDK's
+    # upload sends the raw bytes; no base64 copy or JSON body is built here.
+    try:
+        ws.workspace.upload(
+            path=_INIT_SCRIPT_WS_PATH,
+            content=_bundled_asset(_INIT_SCRIPT_LOCAL),
+            format=ImportFormat.AUTO,
+            overwrite=True,
+        )
+    except Exception:
+        _ENSURED_DIRS.discard((key, _WS_DIR))
+        raise
+    _INIT_SCRIPT_UPLOADED.add(key)
     return _INIT_SCRIPT_WS_PATH
 
 
 def _current_identity(ws: WorkspaceClient) -> str:
-    me = ws.current_user.me()
+    me = get_current_user(ws)
     return getattr(me, "application_id", None) or me.user_name or (me.id or "")
 
 
 def _workspace_url(ws: WorkspaceClient) -> str:
-    return (getattr(ws.config, "host", "") or "").rstrip("/")
+    host = getattr(ws.config, "host", "") or ""
+    return normalize_workspace_url(host) if host else ""
 
 
 # --------------------------------------------------------------------------- #
 # App-owned benchmark cluster
 # --------------------------------------------------------------------------- #
-def _benchmark_cluster_config(ws: WorkspaceClient, node_type: str) -> dict:
+def _benchmark_cluster_config(ws: WorkspaceClient, cloud: str, node_type: str, init_path: str) -> dict:
     """All-purpose single-node cluster spec for the app-owned pgbench cluster.
 
     Reuses the job-cluster builder (single-node, init script that installs
     ``postgresql-client``, sizing) and adds the bits an interactive cluster needs: a
     stable name, auto-termination, and a lookup tag.
     """
-    cfg = _new_cluster_config(ws, node_type, _current_identity(ws), _upload_init_script(ws))
+    cfg = _new_cluster_config(cloud, node_type, _current_identity(ws), init_path)
     cfg["cluster_name"] = _CLUSTER_NAME
     cfg["autotermination_minutes"] = _cluster_autotermination_min()
     cfg["custom_tags"] = {**cfg.get("custom_tags", {}), "pgbench_cluster": "true"}
     return cfg
 
 
+# Benchmark cluster id per workspace URL, remembered once found or created. The
+# clusters list API pages with an opaque cursor, so its pages can't be fetched
+# concurrently; a direct ``clusters.get`` on the known id skips the listing instead.
+_BENCHMARK_CLUSTER_IDS: dict[str, str] = {}
+# The benchmark cluster is created through the API (or, if hand-recreated, the UI), so
+# the listing is narrowed server-side to those sources: job, pipeline and SQL clusters —
+# usually most of a busy workspace's entries — are never paged through.
+_CLUSTER_LIST_FILTER = ListClustersFilterBy(
+    cluster_sources=[ClusterSource.API, ClusterSource.UI]
+)
+
+
 def _find_benchmark_cluster(ws: WorkspaceClient) -> Optional[Any]:
-    for c in ws.clusters.list():
+    key = _workspace_url(ws)
+    known = _BENCHMARK_CLUSTER_IDS.get(key)
+    if known:
+        try:
+            c = ws.clusters.get(cluster_id=known)
+            if c.cluster_name == _CLUSTER_NAME:
+                return c
+        except Exception as e:  # noqa: BLE001 - deleted/unreadable: fall back to listing
+            logger.info("pgbench cluster: cached id %s not usable: %s", known, e)
+        _BENCHMARK_CLUSTER_IDS.pop(key, None)
+    for c in ws.clusters.list(filter_by=_CLUSTER_LIST_FILTER):
         if c.cluster_name == _CLUSTER_NAME:
+            if c.cluster_id:
+                _BENCHMARK_CLUSTER_IDS[key] = c.cluster_id
             return c
     return None
 
 
-def _get_or_create_benchmark_cluster(ws: WorkspaceClient) -> str:
+def _get_or_create_benchmark_cluster(ws: WorkspaceClient, init_path: Future[str]) -> str:
     """Return the app-owned dedicated pgbench cluster, creating it if absent.
 
     The app service principal owns one fixed-size single-node cluster per workspace
@@ -220,22 +312,34 @@ def _get_or_create_benchmark_cluster(ws: WorkspaceClient) -> str:
     every run reuses the same warm cluster — no per-run resize, so no restart and a stable
     egress IP. A terminated cluster is auto-started when the job attaches. If the fixed
     tier changed (a redeploy) the existing cluster is edited to match.
+
+    ``init_path`` is the in-flight init-script upload, awaited only once the lookup is
+    done and the spec (or the reused cluster) needs it.
     """
-    node_type = _benchmark_node_type(ws)
+    # The cloud is detected once and passed down to both the node type and the spec.
+    cloud = _detect_cloud(ws)
+    node_type = _benchmark_node_type(cloud)
     existing = _find_benchmark_cluster(ws)
-    cfg = _benchmark_cluster_config(ws, node_type)
+    # The full spec (which costs an identity lookup) is only built when the cluster has
+    # to be created or reconciled; reusing a matching one only needs the init script
+    # it boots with kept current.
     if existing is None:
+        cfg = _benchmark_cluster_config(ws, cloud, node_type, init_path.result())
         resp = ws.api_client.do("POST", "/api/2.0/clusters/create", body=cfg)
         cluster_id = str(resp.get("cluster_id")) if isinstance(resp, dict) else ""
-        logger.info(f"pgbench cluster: created {cluster_id} (node_type={node_type})")
+        if cluster_id:
+            _BENCHMARK_CLUSTER_IDS[_workspace_url(ws)] = cluster_id
+        logger.info("pgbench cluster: created %s (node_type=%s)", cluster_id, node_type)
         return cluster_id
 
     cluster_id = existing.cluster_id or ""
     if (existing.node_type_id or "") != node_type:
+        cfg = _benchmark_cluster_config(ws, cloud, node_type, init_path.result())
         ws.api_client.do("POST", "/api/2.0/clusters/edit", body={**cfg, "cluster_id": cluster_id})
-        logger.info(f"pgbench cluster: reconciled {cluster_id} to node_type={node_type}")
+        logger.info("pgbench cluster: reconciled %s to node_type=%s", cluster_id, node_type)
     else:
-        logger.info(f"pgbench cluster: reusing {cluster_id} (node_type={node_type})")
+        init_path.result()
+        logger.info("pgbench cluster: reusing %s (node_type=%s)", cluster_id, node_type)
     return cluster_id
 
 
@@ -250,9 +354,16 @@ def _find_job_id(ws: WorkspaceClient, name: str) -> Optional[int]:
     return None
 
 
-def _get_or_create_job(ws: WorkspaceClient, cluster_id: str) -> str:
+def _prepare_job(ws: WorkspaceClient) -> tuple[str, Optional[int]]:
+    """The cluster-independent half of job setup: upload the notebook and look up an
+    existing job. Returns (notebook path, existing job id or None)."""
+    return _upload_notebook(ws), _find_job_id(ws, _JOB_NAME)
+
+
+def _get_or_create_job(
+    ws: WorkspaceClient, cluster_id: str, notebook_path: str, existing_id: Optional[int]
+) -> str:
     """Return the reusable pgbench job, pointed at the app-owned benchmark cluster."""
-    notebook_path = _upload_notebook(ws)
     task: dict[str, Any] = {
         "task_key": "pgbench_test",
         "notebook_task": {"notebook_path": notebook_path, "base_parameters": {}},
@@ -271,21 +382,24 @@ def _get_or_create_job(ws: WorkspaceClient, cluster_id: str) -> str:
         "timeout_seconds": _TIMEOUT_SECONDS,
     }
 
-    existing_id = _find_job_id(ws, _JOB_NAME)
     if existing_id is None:
         resp = ws.api_client.do("POST", "/api/2.1/jobs/create", body=settings)
         job_id = str(resp.get("job_id")) if isinstance(resp, dict) else ""
-        logger.info(f"pgbench job: created job {job_id}")
+        logger.info("pgbench job: created job %s", job_id)
         return job_id
 
     # Reset so the job always points at the current benchmark cluster.
     ws.api_client.do(
         "POST", "/api/2.1/jobs/reset", body={"job_id": existing_id, "new_settings": settings}
     )
-    logger.info(f"pgbench job: reused/updated job {existing_id}")
+    logger.info("pgbench job: reused/updated job %s", existing_id)
     return str(existing_id)
 
 
+# Workspace URLs whose secret scope is known to exist (a token write has succeeded).
+_SECRET_SCOPE_READY: set[str] = set()
+
+
 def _ensure_token_secret(ws: WorkspaceClient, token: str) -> None:
     """Stash the DB token in a secret scope owned by the app SP.
 
@@ -293,21 +407,29 @@ def _ensure_token_secret(ws: WorkspaceClient, token: str) -> None:
     the benchmark still connects to Postgres as the user; writing it to a secret and
     reading it via ``dbutils.secrets.get`` in the notebook keeps it out of the job's run
     parameters/logs. Idempotent: the scope is created once, the key overwritten per run.
+    Once a write has succeeded the scope is known to exist, so later runs in this process
+    go straight to the write instead of re-attempting a create that can only fail with
+    RESOURCE_ALREADY_EXISTS.
     """
-    try:
-        ws.secrets.create_scope(scope=_SECRET_SCOPE)
-    except Exception as e:  # noqa: BLE001 - already-exists is expected on reruns
-        if "RESOURCE_ALREADY_EXISTS" not in str(e):
-            logger.info(f"pgbench: secret scope create note: {e}")
+    key = _workspace_url(ws)
+    if key not in _SECRET_SCOPE_READY:
+        try:
+            ws.secrets.create_scope(scope=_SECRET_SCOPE)
+        except Exception as e:  # noqa: BLE001 - already-exists is expected on reruns
+            if "RESOURCE_ALREADY_EXISTS" not in str(e):
+                logger.info("pgbench: secret scope create note: %s", e)
     try:
         ws.secrets.put_secret(scope=_SECRET_SCOPE, key=_SECRET_KEY, string_value=token)
     except Exception as e:  # noqa: BLE001
+        # The scope may have been deleted since; attempt the create again next run.
+        _SECRET_SCOPE_READY.discard(key)
         sp = _current_identity(ws)
         raise ValueError(
             f"Could not store the database token in secret scope '{_SECRET_SCOPE}'. The "
             f"app service principal ({sp}) needs permission to create/write secret scopes "
             f"in this workspace. Ask a workspace admin to grant it, then retry. ({e})"
         ) from e
+    _SECRET_SCOPE_READY.add(key)
 
 
 # Per-process cache of the (stable) benchmark cluster + job ids. The first submit of each
@@ -318,20 +440,41 @@ def _ensure_token_secret(ws: WorkspaceClient, token: str) -> None:
 # cluster was deleted out from under us.
 _cached_cluster_id: Optional[str] = None
 _cached_job_id: Optional[str] = None
+# Serializes the cold setup: submits that race in before the cache is filled wait for the
+# first one's result instead of each listing (and possibly each creating) the cluster
+# and job.
+_RESOLVE_LOCK = threading.Lock()
 
 
 def _resolve_job(ws: WorkspaceClient, *, force: bool = False) -> str:
     """Return the pgbench job id, provisioning the cluster + job on first use and caching
     both for the life of the worker process."""
     global _cached_cluster_id, _cached_job_id
-    if force:
-        _cached_cluster_id = None
-        _cached_job_id = None
-    if _cached_cluster_id is None:
-        _cached_cluster_id = _get_or_create_benchmark_cluster(ws)
-    if _cached_job_id is None:
-        _cached_job_id = _get_or_create_job(ws, _cached_cluster_id)
-    return _cached_job_id
+    job_id = _cached_job_id
+    if job_id is not None and not force:
+        return job_id
+    with _RESOLVE_LOCK:
+        if force:
+            _cached_cluster_id = None
+            _cached_job_id = None
+            # Whatever removed the job or cluster may have taken the resources folder
+            # with it, so the rebuild re-creates it rather than trusting the cache.
+            _ENSURED_DIRS.clear()
+            # A recreated cluster must boot with the init script (postgresql-client).
+            _INIT_SCRIPT_UPLOADED.clear()
+        elif _cached_job_id is not None:  # filled by the submit this call waited on
+            return _cached_job_id
+        # The init-script upload and the notebook upload + job lookup don't depend on
+        # the cluster, so they run on side threads while the cluster is looked up (and
+        # created if need be): the cold path costs the longest chain, not the sum.
+        pool = ThreadPoolExecutor(max_workers=2)
+        init_path = pool.submit(_upload_init_script, ws)
+        job_prep = pool.submit(_prepare_job, ws)
+        pool.shutdown(wait=False)  # the submitted calls still run; nothing else queues
+        if _cached_cluster_id is None:
+            _cached_cluster_id = _get_or_create_benchmark_cluster(ws, init_path)
+        _cached_job_id = _get_or_create_job(ws, _cached_cluster_id, *job_prep.result())
+        return _cached_job_id
 
 
 def submit(
@@ -346,7 +489,9 @@ def submit(
     # Validate the schema up front (raises ValueError) and build the PGOPTIONS the
     # notebook exports so unqualified table names resolve to the chosen schema.
     pgoptions = search_path_option(schema) or ""
-    query_json = json.dumps(queries)
+    # Compact separators: the notebook only json.loads it, and every byte of padding
+    # counts against the inline parameter limit below.
+    query_json = json.dumps(queries, separators=(",", ":"))
     if len(query_json) > _INLINE_QUERY_LIMIT:
         raise ValueError(
             "Query payload is too large to pass inline to the job. "
@@ -413,8 +558,24 @@ _STATE_MAP = {
 }
 
 
+# Settled (completed/failed) run statuses by (workspace URL, run id). A finished run never
+# changes, but remounts, window refocus and other tabs still poll it, and each poll
+# re-read the run and its task output and re-parsed the results. Oldest entries are
+# evicted past the cap. A completed run whose output couldn't be read isn't cached, so
+# a later poll retries the read.
+_SETTLED_STATUS: dict[tuple[str, str], dict[str, Any]] = {}
+_SETTLED_STATUS_MAX = 256
+_SETTLED_STATUS_LOCK = threading.Lock()
+
+
 def run_status(ws: WorkspaceClient, run_id: str) -> dict[str, Any]:
     """Map a job run to {status, message, progress, pgbench_results}."""
+    key = (_workspace_url(ws), run_id)
+    with _SETTLED_STATUS_LOCK:
+        cached = _SETTLED_STATUS.get(key)
+    if cached is not None:
+        return cached
+
     run = ws.jobs.get_run(int(run_id))
     state = run.state
     life = state.life_cycle_state.value if state and state.life_cycle_state else "UNKNOWN"
@@ -437,9 +598,16 @@ def run_status(ws: WorkspaceClient, run_id: str) -> dict[str, Any]:
         try:
             out["pgbench_results"] = _fetch_pgbench_results(ws, run)
         except Exception as e:  # noqa: BLE001
-            logger.info(f"pgbench job: could not read run output: {e}")
+            logger.info("pgbench job: could not read run output: %s", e)
+            return out
     elif status == "failed":
         out["error"] = _failure_detail(ws, run)
+    else:
+        return out
+    with _SETTLED_STATUS_LOCK:
+        if len(_SETTLED_STATUS) >= _SETTLED_STATUS_MAX:
+            del _SETTLED_STATUS[next(iter(_SETTLED_STATUS))]
+        _SETTLED_STATUS[key] = out
     return out
 
 
@@ -499,6 +667,11 @@ def _permission_suggestion(ws: WorkspaceClient, cause: str) -> Optional[str]:
     )
 
 
+# Fields of the IP-ACL rejection message: the blocked source IP and the workspace id.
+_ACL_SOURCE_IP_RE = re.compile(r"source ip address:\s*([0-9a-fA-F:.]+)", re.IGNORECASE)
+_ACL_WORKSPACE_RE = re.compile(r"workspace:\s*(\d+)", re.IGNORECASE)
+
+
 def _ip_acl_suggestion(ws: WorkspaceClient, cause: Optional[str]) -> Optional[str]:
     """If the failure is a workspace IP-ACL rejection, extract the blocked source IP and
     explain the one-time allow-list fix — naming the exact workspace and targeting the
@@ -510,9 +683,9 @@ def _ip_acl_suggestion(ws: WorkspaceClient, cause: Optional[str]) -> Optional[st
     low = (cause or "").lower()
     if "external authorization failed" not in low and "blocked by databricks ip acl" not in low:
         return None
-    m = re.search(r"source ip address:\s*([0-9a-fA-F:.]+)", cause or "", re.IGNORECASE)
+    m = _ACL_SOURCE_IP_RE.search(cause or "")
     ip = m.group(1).rstrip(".") if m else None
-    m_ws = re.search(r"workspace:\s*(\d+)", cause or "", re.IGNORECASE)
+    m_ws = _ACL_WORKSPACE_RE.search(cause or "")
     ws_id = m_ws.group(1) if m_ws else None
     host = _workspace_url(ws)  # the workspace this app (and its cluster) run in
 
@@ -603,21 +776,19 @@ def _fetch_pgbench_results(ws: WorkspaceClient, run: Any) -> Optional[dict[str,
 
 
 def _parse_notebook_result(raw: str) -> Optional[dict[str, Any]]:
+    # The notebook's exit payload carries pgbench's full stdout plus per-query stats;
+    # pydantic-core's Rust parser (already a dependency via pydantic) decodes it well
+    # ahead of json.
     try:
-        return json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
+        return from_json(raw)
+    except (ValueError, TypeError):
         return None
 
 
-def parse_pgbench_stdout(raw_output: str) -> Optional[dict[str, Any]]:
-    """Parse pgbench summary statistics from its stdout.
-
-    Shared by the Databricks-job runner and the local (dev) runner so both surface
-    identical metrics.
-    """
-    if not raw_output:
-        return None
-    patterns = {
+# pgbench summary fields, compiled once and shared by the job and local runners.
+_PGBENCH_PATTERNS = {
+    key: re.compile(pattern)
+    for key, pattern in {
         "transaction_type": r"transaction type:\s*(.+)",
         "scaling_factor": r"scaling factor:\s*(\d+)",
         "query_mode": r"query mode:\s*(\w+)",
@@ -630,20 +801,37 @@ def parse_pgbench_stdout(raw_output: str) -> Optional[dict[str, Any]]:
         "latency_stddev_ms": r"latency stddev\s*=\s*([\d.]+)\s*ms",
         "initial_connection_time_ms": r"initial connection time\s*=\s*([\d.]+)\s*ms",
         "tps": r"tps\s*=\s*([\d.]+)",
-    }
-    int_keys = {"scaling_factor", "num_clients", "num_threads", "duration",
-                "total_transactions", "failed_transactions"}
-    float_keys = {"latency_avg_ms", "latency_stddev_ms", "initial_connection_time_ms", "tps"}
+    }.items()
+}
+_INT_KEYS = frozenset({"scaling_factor", "num_clients", "num_threads", "duration",
+                       "total_transactions", "failed_transactions"})
+_FLOAT_KEYS = frozenset({"latency_avg_ms", "latency_stddev_ms", "initial_connection_time_ms", "tps"})
+
+
+def parse_pgbench_stdout(raw_output: str) -> Optional[dict[str, Any]]:
+    """Parse pgbench summary statistics from its stdout.
+
+    Shared by the Databricks-job runner and the local (dev) runner so both surface
+    identical metrics.
+    """
+    if not raw_output:
+        return None
+
+    # The summary follows the (on long runs, by far larger) progress log and opens with
+    # its "transaction type:" line. Searching from there walks the progress lines once
+    # instead of once per field; without that line the whole output is searched.
+    summary_start = raw_output.find("transaction type:")
+    summary = raw_output[summary_start:] if summary_start > 0 else raw_output
 
     results: dict[str, Any] = {}
-    for key, pattern in patterns.items():
-        m = re.search(pattern, raw_output)
+    for key, pattern in _PGBENCH_PATTERNS.items():
+        m = pattern.search(summary)
         if not m:
             continue
         val = m.group(1)
-        if key in int_keys:
+        if key in _INT_KEYS:
             results[key] = int(val)
-        elif key in float_keys:
+        elif key in _FLOAT_KEYS:
             results[key] = float(val)
         else:
             results[key] = val.strip()
@@ -16,14 +16,16 @@ are polled by ``run_id`` to mirror the job-runner UX.
 
 from __future__ import annotations
 
-import glob
+import logging
 import os
+import secrets
 import shutil
 import subprocess
 import tempfile
 import threading
 import time
-import uuid
+from collections import defaultdict
+from functools import lru_cache
 from typing import Any, Optional
 
 from ..core import logger
@@ -33,19 +35,25 @@ from .pgbench_job import parse_pgbench_stdout
 from .stats import percentile
 
 # Env vars Databricks Apps inject into the running container; presence ⇒ production.
+# The container's environment is fixed for the process, so this is read once at import.
 _APP_ENV_MARKERS = ("DATABRICKS_APP_NAME", "DATABRICKS_APP_PORT")
+_IS_DATABRICKS_APP = any(os.environ.get(k) for k in _APP_ENV_MARKERS)
 
 # Hard ceiling so a wedged subprocess can't run forever (duration + this grace).
 _GRACE_SECONDS = 120
 
 
-def _is_databricks_app() -> bool:
-    return any(os.environ.get(k) for k in _APP_ENV_MARKERS)
+@lru_cache(maxsize=1)
+def _pgbench_path() -> Optional[str]:
+    # Resolved once: ``shutil.which`` stats every PATH entry, and availability is
+    # checked on each submit and status poll. Like the env markers, PATH is fixed for
+    # the process (the capabilities response is cached on the same assumption).
+    return shutil.which("pgbench")
 
 
 def local_available() -> bool:
     """True only off-Databricks-App *and* when the ``pgbench`` binary is on PATH."""
-    return (not _is_databricks_app()) and shutil.which("pgbench") is not None
+    return (not _IS_DATABRICKS_APP) and _pgbench_path() is not None
 
 
 # --------------------------------------------------------------------------- #
@@ -54,10 +62,31 @@ def local_available() -> bool:
 _LOCK = threading.Lock()
 _RUNS: dict[str, dict[str, Any]] = {}
 
+# Finished runs (with their full results) are kept long enough for the UI to poll
+# the final state, then dropped so a long-lived dev server doesn't accumulate every
+# run it ever did. Running runs are never evicted.
+_FINISHED_TTL_SECONDS = 3600
+_MAX_FINISHED_RUNS = 256
+_TERMINAL = ("completed", "failed")
+
 
 def _set(run_id: str, **patch: Any) -> None:
     with _LOCK:
-        _RUNS.setdefault(run_id, {}).update(patch)
+        run = _RUNS.setdefault(run_id, {})
+        run.update(patch)
+        if patch.get("status") in _TERMINAL:
+            run["_finished_at"] = time.monotonic()
+
+
+def _prune_locked() -> None:
+    """Evict expired finished runs, then the oldest beyond the cap (caller holds _LOCK)."""
+    cutoff = time.monotonic() - _FINISHED_TTL_SECONDS
+    finished = [(rid, r["_finished_at"]) for rid, r in _RUNS.items() if "_finished_at" in r]
+    excess = len(finished) - _MAX_FINISHED_RUNS
+    # dicts keep insertion order, so the earliest-submitted finished runs come first.
+    for i, (rid, finished_at) in enumerate(finished):
+        if finished_at < cutoff or i < excess:
+            del _RUNS[rid]
 
 
 def run_status(run_id: str) -> dict[str, Any]:
@@ -68,7 +97,10 @@ def run_status(run_id: str) -> dict[str, Any]:
             return {
                 "run_id": run_id,
                 "status": "failed",
-                "message": "Unknown run id (local runs are in-memory and reset on restart).",
+                "message": (
+                    "Unknown run id (local runs are in-memory, expire an hour after "
+                    "finishing, and reset on restart)."
+                ),
                 "progress": 100,
                 "pgbench_results": None,
                 "error": "unknown run id",
@@ -93,7 +125,9 @@ def submit(
     """Start a local pgbench run in a background thread and return its run id."""
     # Validate the schema up front (raises ValueError) so a bad value fails the request.
     search_path = search_path_option(schema)
-    run_id = uuid.uuid4().hex
+    run_id = secrets.token_hex(16)
+    with _LOCK:
+        _prune_locked()
     _set(
         run_id,
         status="pending",
@@ -111,29 +145,73 @@ def submit(
     return {"run_id": run_id, "status": "submitted"}
 
 
-def _latency_percentiles(workdir: str) -> dict[str, float]:
-    """Compute p50/p95/p99 (ms) from pgbench's per-transaction logs (the ``-l`` flag).
+def _write_private(path: str, data: bytes) -> None:
+    """Write ``data`` to a new owner-only (0600) file with raw ``os.write`` calls.
+
+    The scripts are tiny and written once, so the text-IO layer buys nothing; 0600
+    keeps the user's query mix private on a shared host.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _read_log(path: str) -> list[tuple[Optional[int], float]]:
+    """``(script_no, latency_ms)`` for every transaction line of one ``-l`` log file.
 
     pgbench log line: ``client_id transaction_no time script_no time_epoch time_us``;
-    column index 2 (``time``) is the transaction latency in microseconds. Returns {}
-    when detailed logging is off or no log lines are present.
+    column index 2 (``time``) is the transaction latency in microseconds and index 3
+    the 0-based script number (None if a line is too short to carry it).
+
+    Read as bytes: the log is plain ASCII numbers, and ``float``/``int`` parse bytes
+    fields directly, so no line is ever decoded to ``str``.
     """
-    latencies: list[float] = []
-    for path in glob.glob(os.path.join(workdir, "pgbench_log.*")):
-        try:
-            with open(path) as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        try:
-                            latencies.append(float(parts[2]) / 1000.0)
-                        except ValueError:
-                            continue
-        except OSError:
-            continue
+    samples: list[tuple[Optional[int], float]] = []
+    try:
+        with open(path, "rb") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                try:
+                    latency = float(parts[2]) / 1000.0
+                except ValueError:
+                    continue
+                try:
+                    script_no = int(parts[3]) if len(parts) >= 4 else None
+                except ValueError:
+                    script_no = None
+                samples.append((script_no, latency))
+    except OSError:
+        pass
+    return samples
+
+
+def _read_logs(workdir: str) -> list[tuple[Optional[int], float]]:
+    """All transaction samples from pgbench's per-thread ``-l`` logs, read once.
+
+    pgbench writes one log file per worker thread (``-j``); both the overall
+    percentiles and the per-query breakdown are derived from this single pass instead
+    of each re-reading every file. The files are local and parsing them is pure Python,
+    so they're read in turn — threads would only contend for the GIL.
+    """
+    with os.scandir(workdir) as entries:
+        paths = [e.path for e in entries if e.name.startswith("pgbench_log.") and e.is_file()]
+    return [sample for path in paths for sample in _read_log(path)]
+
+
+def _latency_percentiles(samples: list[tuple[Optional[int], float]]) -> dict[str, float]:
+    """Compute p50/p95/p99 (ms) from the ``-l`` log samples (see :func:`_read_logs`).
+
+    Returns {} when detailed logging is off or no log lines are present.
+    """
+    latencies = sorted(latency for _, latency in samples)
     if not latencies:
         return {}
-    latencies.sort()
     return {
         "latency_p50_ms": round(percentile(latencies, 50), 3),
         "latency_p95_ms": round(percentile(latencies, 95), 3),
@@ -141,29 +219,20 @@ def _latency_percentiles(workdir: str) -> dict[str, float]:
     }
 
 
-def _per_query_from_logs(workdir: str, query_names: list[str]) -> list[dict[str, Any]]:
-    """Per-query (per pgbench script) calls/avg/total/p95/p99 from the ``-l`` logs.
+def _per_query_from_logs(
+    samples: list[tuple[Optional[int], float]], query_names: list[str]
+) -> list[dict[str, Any]]:
+    """Per-query (per pgbench script) calls/avg/total/p95/p99 from the ``-l`` samples.
 
-    The log's column index 3 is ``script_no`` (0-based, in the order scripts were
-    passed with ``-f``), so it maps back to ``query_names``. Sorted by total time
-    descending, like Lakebase's query performance view. Returns [] when detailed
-    logging is off or no log lines are present.
+    ``script_no`` is 0-based, in the order scripts were passed with ``-f``, so it maps
+    back to ``query_names``. Sorted by total time descending, like Lakebase's query
+    performance view. Returns [] when detailed logging is off or no log lines are
+    present.
     """
-    from collections import defaultdict
-
     groups: dict[int, list[float]] = defaultdict(list)
-    for path in glob.glob(os.path.join(workdir, "pgbench_log.*")):
-        try:
-            with open(path) as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) >= 4:
-                        try:
-                            groups[int(parts[3])].append(float(parts[2]) / 1000.0)
-                        except ValueError:
-                            continue
-        except OSError:
-            continue
+    for script_no, latency in samples:
+        if script_no is not None:
+            groups[script_no].append(latency)
 
     out: list[dict[str, Any]] = []
     for script_no, lat in groups.items():
@@ -186,7 +255,7 @@ def _per_query_from_logs(workdir: str, query_names: list[str]) -> list[dict[str,
 def _build_cmd(config: dict[str, Any], query_files: list[tuple[str, Any]]) -> list[str]:
     """Mirror the Databricks-job notebook's pgbench invocation."""
     cmd = [
-        "pgbench",
+        _pgbench_path() or "pgbench",
         "-n",  # skip vacuum (custom scripts)
         "-c", str(config.get("clients", 8)),
         "-j", str(config.get("jobs", 8)),
@@ -223,8 +292,7 @@ def _run(
         for q in queries:
             name = q.get("name", "query")
             path = os.path.join(tmpdir, f"{name}.sql")
-            with open(path, "w") as f:
-                f.write((q.get("content", "") or "").strip() + "\n")
+            _write_private(path, ((q.get("content", "") or "").strip() + "\n").encode())
             query_files.append((path, q.get("weight", 1)))
 
         env = os.environ.copy()
@@ -244,44 +312,51 @@ def _run(
             env["PGOPTIONS"] = search_path
 
         cmd = _build_cmd(config, query_files)
-        # Password lives only in env, so logging the command is safe.
-        logger.info(f"pgbench local [{run_id}]: {' '.join(cmd)}")
+        # Password lives only in env, so logging the command is safe. Debug-only (and
+        # guarded) so the command line isn't joined on every run just to be dropped.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("pgbench local [%s]: %s", run_id, " ".join(cmd))
         _set(run_id, status="running", message="Running local pgbench…", progress=5)
 
         # Snapshot DB cache counters around the run for a per-run cache hit %, the
         # same delta the psycopg runner reports.
         cache_before = read_cache_counters(creds)
 
-        proc = subprocess.Popen(
-            cmd, env=env, cwd=tmpdir,
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
-        )
-
-        # Drain stdout in a helper thread (so the pipe never fills) while we tick progress.
-        output: dict[str, str] = {}
-
-        def _drain() -> None:
-            out, _ = proc.communicate()
-            output["out"] = out or ""
-
-        reader = threading.Thread(target=_drain, daemon=True)
-        reader.start()
+        # pgbench's stdout goes straight to a file in the run dir: the pipe can never
+        # fill, so no helper thread is needed to drain it while we tick progress.
+        out_path = os.path.join(tmpdir, "pgbench.out")
+        with open(out_path, "wb") as out_file:
+            proc = subprocess.Popen(
+                cmd, env=env, cwd=tmpdir, stdout=out_file, stderr=subprocess.STDOUT,
+            )
 
         duration = max(int(config.get("duration_seconds", 30)), 1)
         deadline = time.time() + duration + _GRACE_SECONDS
         start = time.time()
-        while reader.is_alive():
+        # Pollers only ever read the latest snapshot, so publish a tick only when the
+        # percentage actually moves — long runs otherwise take the registry lock every
+        # second just to rewrite the same value.
+        last_progress = 5
+        while True:
             elapsed = time.time() - start
-            _set(run_id, progress=min(95, 5 + int(elapsed / duration * 90)))
+            progress = min(95, 5 + int(elapsed / duration * 90))
+            if progress != last_progress:
+                _set(run_id, progress=progress)
+                last_progress = progress
             if time.time() > deadline:
                 proc.kill()
-                reader.join(timeout=5)
+                proc.wait(timeout=5)
                 _set(run_id, status="failed", progress=100,
                      message="Local pgbench timed out.", error="timed out")
                 return
-            reader.join(timeout=1)
-
-        raw_output = output.get("out", "")
+            try:
+                proc.wait(timeout=1)
+                break
+            except subprocess.TimeoutExpired:
+                continue
+
+        with open(out_path, "rb") as f:
+            raw_output = f.read().decode("utf-8", errors="replace")
         if proc.returncode != 0:
             tail = raw_output.strip()[-2000:]
             _set(run_id, status="failed", progress=100,
@@ -297,14 +372,15 @@ def _run(
 
         # pgbench's summary stdout has no percentiles; derive them (and the per-query
         # breakdown) from the -l log, read before the tmpdir is cleaned up below.
-        summary.update(_latency_percentiles(tmpdir))
-        summary["per_query"] = _per_query_from_logs(tmpdir, [q.get("name", "") for q in queries])
+        samples = _read_logs(tmpdir)
+        summary.update(_latency_percentiles(samples))
+        summary["per_query"] = _per_query_from_logs(samples, [q.get("name", "") for q in queries])
         summary["cache_hit_pct"] = cache_hit_delta(cache_before, read_cache_counters(creds))
 
         _set(run_id, status="completed", progress=100,
              message="Local pgbench completed successfully.", pgbench_results=summary)
     except Exception as e:  # noqa: BLE001
-        logger.info(f"pgbench local [{run_id}] failed: {e}")
+        logger.info("pgbench local [%s] failed: %s", run_id, e)
         _set(run_id, status="failed", progress=100, message=str(e), error=str(e))
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
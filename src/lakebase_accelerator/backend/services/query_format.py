@@ -33,7 +33,8 @@ from __future__ import annotations
 
 import random
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 DEFAULT_WEIGHT = 1
@@ -47,11 +48,16 @@ _VALUES_RE = re.compile(r"^values\(\s*(.+?)\s*\)$", re.IGNORECASE)
 # One item of a values(...) list: a single/double-quoted string (doubled quote escapes)
 # or an integer.
 _VALUE_ITEM_RE = re.compile(r"""'((?:[^']|'')*)'|"((?:[^"]|"")*)"|(-?\d+)""")
+# Directive comment lines (``-- WEIGHT:`` / ``-- PARAM``), captured without the
+# surrounding whitespace, and any whole-line comment or blank line (with its newline)
+# for stripping. Scanning the body with these runs in C instead of a per-line loop.
+_DIRECTIVE_RE = re.compile(r"^[ \t]*(-- (?:WEIGHT:|PARAM).*?)[ \t\r]*$", re.IGNORECASE | re.MULTILINE)
+_NON_SQL_LINE_RE = re.compile(r"^[ \t\r]*(?:--[^\n]*)?(?:\n|\Z)", re.MULTILINE)
 # ``:name`` placeholder, but not ``::cast`` and not inside ``:=``.
 _PLACEHOLDER_RE = re.compile(r"(?<!:):([a-zA-Z_]\w*)")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParamSpec:
     """A test parameter drawn fresh per execution. Either a uniform integer range
     (``min_value``/``max_value``) or a discrete ``values`` list of ints/strings."""
@@ -111,48 +117,65 @@ def _parse_param(line: str) -> ParamSpec | None:
     )
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedQuery:
     identifier: str
     sql: str  # comments stripped; still uses :name placeholders
-    params: list[ParamSpec] = field(default_factory=list)
+    params: tuple[ParamSpec, ...] = ()
     weight: int = DEFAULT_WEIGHT
 
 
+# Bodies up to this size are memoized. Queries may be far larger (the request limit is
+# 1M chars), and 256 of those — plus their stripped SQL — pinned for the process's life
+# would cost hundreds of MB; larger ones are simply parsed each time.
+_CACHED_QUERY_MAX_CHARS = 16_384
+
+
 def parse_query(identifier: str, content: str) -> ParsedQuery:
     """Parse one unified query body into SQL + directives.
 
     A legacy ``-- EXEC_COUNT:`` line is harmlessly ignored (psycopg now derives counts
     from weight + a global total).
 
+    Memoized on ``(identifier, content)`` for bodies up to ``_CACHED_QUERY_MAX_CHARS``:
+    the same mix is typically re-run many times (baseline vs optimized, concurrency
+    sweeps, EXPLAIN), so repeats skip the parse. Results are shared, hence the frozen
+    dataclasses. Errors are not cached.
+
     Raises ``ValueError`` if the SQL references a ``:name`` placeholder that has no
     matching ``-- PARAM`` declaration — caught early here so the user gets a clear,
     actionable message instead of a cryptic bind-parameter error mid-run.
     """
+    if len(content) <= _CACHED_QUERY_MAX_CHARS:
+        return _parse_query_cached(identifier, content)
+    return _parse_query(identifier, content)
+
+
+def _parse_query(identifier: str, content: str) -> ParsedQuery:
     params: list[ParamSpec] = []
     weight = DEFAULT_WEIGHT
-    sql_lines: list[str] = []
-
-    for raw in content.split("\n"):
-        line = raw.strip()
-        if not line:
-            continue
-        upper = line.upper()
-        if upper.startswith("-- WEIGHT:"):
+
+    # Every directive starts with "-- ", so a body without one (a plain query relying
+    # on the default weight and no params) skips the directive scan entirely.
+    directives = _DIRECTIVE_RE.finditer(content) if "-- " in content else ()
+    for m in directives:
+        line = m.group(1)
+        if line[3:10].upper() == "WEIGHT:":
             try:
                 weight = max(1, int(line.split(":", 1)[1].strip()))
             except ValueError:
                 weight = DEFAULT_WEIGHT
-        elif upper.startswith("-- PARAM"):
+        else:
             spec = _parse_param(line)
             if spec:
                 params.append(spec)
-        elif not line.startswith("--"):
-            sql_lines.append(raw)
 
-    sql = "\n".join(sql_lines).strip()
+    sql = _NON_SQL_LINE_RE.sub("", content).strip()
     _validate_placeholders(identifier, sql, params)
-    return ParsedQuery(identifier=identifier, sql=sql, params=params, weight=weight)
+    return ParsedQuery(identifier=identifier, sql=sql, params=tuple(params), weight=weight)
+
+
+_parse_query_cached = lru_cache(maxsize=256)(_parse_query)
 
 
 def _validate_placeholders(identifier: str, sql: str, params: list[ParamSpec]) -> None:
@@ -178,30 +201,41 @@ def render_psycopg_sql(parsed: ParsedQuery) -> str:
     return _PLACEHOLDER_RE.sub(lambda m: f"%({m.group(1)})s", parsed.sql)
 
 
-def to_execution_queries(parsed: list[ParsedQuery]) -> list[dict[str, Any]]:
+@dataclass(frozen=True, slots=True)
+class ExecutionQuery:
+    """One query as the psycopg runner consumes it: rendered SQL + its param specs.
+
+    Slotted and frozen — the runner reads these once per execution, and the specs are
+    the parsed (shared) :class:`ParamSpec` objects rather than per-run dict copies.
+    """
+
+    identifier: str
+    sql: str  # psycopg-rendered (``%(name)s`` placeholders), comments stripped
+    params: tuple[ParamSpec, ...] = ()
+    weight: int = DEFAULT_WEIGHT
+
+    def draw(self) -> dict[str, int | str] | None:
+        """A fresh bind dict for one execution, or None when there are no params."""
+        return {s.name: s.draw() for s in self.params} if self.params else None
+
+
+def to_execution_queries(parsed: list[ParsedQuery]) -> list[ExecutionQuery]:
     """Shape parsed queries for :meth:`ConnectionPool.run_concurrent`.
 
     Carries the psycopg-rendered SQL, param specs, and the mix ``weight`` (the runner
     distributes the tab's total executions across queries by weight).
     """
     return [
-        {
-            "query_identifier": p.identifier,
-            "query_content": render_psycopg_sql(p),
-            "param_specs": [_serialize_spec(s) for s in p.params],
-            "weight": p.weight,
-        }
+        ExecutionQuery(
+            identifier=p.identifier,
+            sql=render_psycopg_sql(p),
+            params=p.params,
+            weight=p.weight,
+        )
         for p in parsed
     ]
 
 
-def _serialize_spec(s: ParamSpec) -> dict[str, Any]:
-    """JSON-friendly param spec for the runner (range or values list)."""
-    if s.values is not None:
-        return {"name": s.name, "values": s.values}
-    return {"name": s.name, "min_value": s.min_value, "max_value": s.max_value}
-
-
 def distribute_executions(weights: list[int], total: int) -> list[int]:
     """Split ``total`` executions across queries in proportion to their weights.
 
@@ -227,19 +261,6 @@ def distribute_executions(weights: list[int], total: int) -> list[int]:
     return counts
 
 
-def draw_from_specs(param_specs: list[dict[str, Any]]) -> dict[str, int | str]:
-    """Draw one bind dict from the serialized param-spec dicts used by the runner."""
-    out: dict[str, int | str] = {}
-    for s in param_specs:
-        if s.get("values") is not None:
-            out[s["name"]] = ParamSpec(s["name"], values=list(s["values"])).draw()
-        else:
-            out[s["name"]] = ParamSpec(
-                s["name"], min_value=int(s["min_value"]), max_value=int(s["max_value"])
-            ).draw()
-    return out
-
-
 # --------------------------------------------------------------------------- #
 # pgbench rendering
 # --------------------------------------------------------------------------- #
@@ -9,6 +9,7 @@ dynamic range (max − min) must not exceed 8 CU.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 
 # Workload throughput per CU (ported from lakebase_cost_estimator.py)
@@ -18,7 +19,8 @@ READ_CU_RATIO = 10000      # reads/sec (QPS) per CU
 
 # Valid autoscaling CU steps. Lakebase Autoscaling supports 0.5–32 CU for a
 # dynamic range; 36–112 CU is fixed-size only (no autoscaling).
-_VALID_CU = [0.5, 1, 2, 4, 6, 8, 10, 12, 16, 20, 24, 28, 32]
+# Ascending (bisected by _ceil_to_valid) and immutable.
+_VALID_CU = (0.5, 1, 2, 4, 6, 8, 10, 12, 16, 20, 24, 28, 32)
 # Hard constraints from the Lakebase Autoscaling compute docs:
 MAX_AUTOSCALE_CU = 32.0     # autoscale ceiling; above this is fixed-size only
 MIN_AUTOSCALE_CU = 0.5      # smallest CU
@@ -37,10 +39,8 @@ class SizingResult:
 
 
 def _ceil_to_valid(cu: float) -> float:
-    for step in _VALID_CU:
-        if cu <= step:
-            return step
-    return _VALID_CU[-1]
+    """Smallest valid CU step >= ``cu`` (the largest step when ``cu`` exceeds them all)."""
+    return _VALID_CU[min(bisect_left(_VALID_CU, cu), len(_VALID_CU) - 1)]
 
 
 def recommend_cu(
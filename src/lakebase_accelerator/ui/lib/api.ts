@@ -236,7 +236,7 @@ export interface PgbenchConfigIn {
     jobs?: number;
     per_statement_latency?: boolean;
     progress_interval?: number;
-    protocol?: string;
+    protocol?: "simple" | "extended" | "prepared";
 }
 export interface PgbenchLocalSubmitOut {
     error?: string | null;
@@ -273,6 +273,13 @@ export interface PgbenchSubmitOut {
     run_id?: string | null;
     status: string;
 }
+export interface PoolMetricsOut {
+    checked_in_connections?: number | null;
+    checked_out_connections?: number | null;
+    overflow?: number | null;
+    pool_size?: number | null;
+    status: string;
+}
 export interface ProjectInfoOut {
     branch?: string | null;
     endpoints?: EndpointInfoOut[];
@@ -487,7 +494,7 @@ export interface TestReportOut {
     average_execution_time_ms: number;
     cache_hit_pct?: number | null;
     concurrency_level: number;
-    connection_pool_metrics: Record<string, unknown>;
+    connection_pool_metrics: PoolMetricsOut;
     error?: string | null;
     failed_queries: number;
     monitoring_url?: string | null;
@@ -467,6 +467,9 @@ function syncStateLabel(state: string | null | undefined): string {
     .replace(/\b\w/g, (c) => c.toUpperCase());
 }
 
+// Max synced-table creates in flight for "Create all".
+const SYNC_CONCURRENCY = 8;
+
 // Color + wording per status bucket returned by the backend (ok | syncing | failed).
 const SYNC_STATUS_STYLES: Record<string, { dot: string; text: string }> = {
   ok: { dot: "bg-emerald-500", text: "text-emerald-600 dark:text-emerald-400" },
@@ -561,6 +564,31 @@ function SyncSection({ projectLabel }: { projectLabel: string }) {
     }
   };
 
+  // Rows are independent synced tables (one pipeline each), so "Create all" fans the
+  // creates out instead of running them back to back — wall-clock becomes the
+  // slowest table rather than the sum. Bounded so a long list doesn't flood the
+  // workspace API (and the backend's worker threads) all at once.
+  const canSync = (row: SyncRow) =>
+    !!row.source_table_full_name &&
+    !!row.target_uc_name &&
+    !(SYNC_MODES[row.scheduling_policy].requiresCdf && row.check && !row.check.ok);
+  const [syncingAll, setSyncingAll] = useState(false);
+  const onSyncAll = async () => {
+    const pending = rows.flatMap((r, i) => (canSync(r) ? [i] : []));
+    let next = 0;
+    const worker = async () => {
+      while (next < pending.length) await onSyncOne(pending[next++]);
+    };
+    setSyncingAll(true);
+    try {
+      await Promise.all(
+        Array.from({ length: Math.min(SYNC_CONCURRENCY, pending.length) }, worker),
+      );
+    } finally {
+      setSyncingAll(false);
+    }
+  };
+
   const onCheckStatus = async (i: number) => {
     const row = rows[i];
     update(i, { status: undefined });
@@ -579,9 +607,21 @@ function SyncSection({ projectLabel }: { projectLabel: string }) {
           <Database className="h-4 w-4" /> Bulk sync into{" "}
           <code className="text-sm">{projectLabel}</code>
         </CardTitle>
-        <Button variant="outline" size="sm" onClick={() => setRows((rs) => [...rs, { ...emptyRow }])}>
-          <Plus className="mr-1 h-4 w-4" /> Add table
-        </Button>
+        <div className="flex items-center gap-2">
+          {rows.length > 1 && (
+            <Button
+              variant="secondary"
+              size="sm"
+              onClick={onSyncAll}
+              disabled={syncingAll || !rows.some(canSync)}
+            >
+              {syncingAll ? "Creating…" : "Create all"}
+            </Button>
+          )}
+          <Button variant="outline" size="sm" onClick={() => setRows((rs) => [...rs, { ...emptyRow }])}>
+            <Plus className="mr-1 h-4 w-4" /> Add table
+          </Button>
+        </div>
       </CardHeader>
       <CardContent className="space-y-6">
         <div className="rounded-md border bg-muted/30 p-3 text-xs text-muted-foreground">
@@ -854,12 +894,7 @@ function SyncSection({ projectLabel }: { projectLabel: string }) {
 
               <Button
                 onClick={() => onSyncOne(i)}
-                disabled={
-                  createSync.isPending ||
-                  !row.source_table_full_name ||
-                  !row.target_uc_name ||
-                  (modeInfo.requiresCdf && row.check ? !row.check.ok : false)
-                }
+                disabled={createSync.isPending || !canSync(row)}
               >
                 {createSync.isPending ? "Creating…" : "Create synced table"}
               </Button>
@@ -1976,7 +1976,7 @@ interface PgbenchConfigState {
   jobs: number;
   duration_seconds: number;
   progress_interval: number;
-  protocol: string;
+  protocol: "simple" | "extended" | "prepared";
   per_statement_latency: boolean;
   detailed_logging: boolean;
   connect_per_transaction: boolean;
@@ -2033,21 +2033,29 @@ function PgbenchTab() {
   const localAvailable = caps?.data.pgbench_local_available ?? false;
   const isLocal = runMode === "local";
 
-  const refetchInterval = (s: string | undefined) =>
-    s === "completed" || s === "failed" ? false : 3000;
+  // Poll until the run settles, backing off from 3 s towards 10 s as it goes on: a long
+  // run otherwise costs a Jobs API round trip every 3 s for its whole duration. The
+  // jitter keeps tabs that submitted together from polling in lockstep. The poll count
+  // is per query, so it restarts with each run id.
+  const refetchInterval = (s: string | undefined, polls: number) =>
+    s === "completed" || s === "failed"
+      ? false
+      : Math.min(3000 * 1.25 ** polls, 10000) + Math.random() * 500;
 
   const jobStatusQuery = useGetPgbenchRunStatus({
     params: { run_id: runId ?? "" },
     query: {
       enabled: !!runId && !isLocal,
-      refetchInterval: (query) => refetchInterval(query.state.data?.data.status),
+      refetchInterval: (query) =>
+        refetchInterval(query.state.data?.data.status, query.state.dataUpdateCount),
     },
   });
   const localStatusQuery = useGetLocalPgbenchStatus({
     params: { run_id: runId ?? "" },
     query: {
       enabled: !!runId && isLocal,
-      refetchInterval: (query) => refetchInterval(query.state.data?.data.status),
+      refetchInterval: (query) =>
+        refetchInterval(query.state.data?.data.status, query.state.dataUpdateCount),
     },
   });
   const status = (isLocal ? localStatusQuery : jobStatusQuery).data?.data;
@@ -2307,7 +2315,7 @@ function PgbenchTab() {
                 label="Protocol (-M)"
                 tip="How queries are sent: simple (one round-trip), extended (parse/bind/execute), or prepared (server-side prepared statements, usually fastest). pgbench's -M flag."
               />
-              <Select value={config.protocol} onValueChange={(v) => setCfg({ protocol: v })}>
+              <Select value={config.protocol} onValueChange={(v) => setCfg({ protocol: v as PgbenchConfigState["protocol"] })}>
                 <SelectTrigger>
                   <SelectValue />
                 </SelectTrigger>